@@ -3,7 +3,8 @@ Robin AI Client - A unified interface for AI providers
 """
 
 from .factory import AIClientFactory, create_ai_client
-from .base import AIMessage, AIResponse, AIProvider
+from .base import AIMessage, AIResponse, AIProvider, AIStream
+from .cache import LRUResponseCache, ResponseCacheBackend, SemanticCache
 from .exceptions import (
     AIClientError, AIProviderError, AIRateLimitError, 
     AIAuthenticationError, AIModelNotFoundError, AIQuotaExceededError
@@ -11,6 +12,7 @@ from .exceptions import (
 
 __all__ = [
     "AIClientFactory", "create_ai_client", "AIMessage", "AIResponse", "AIProvider",
+    "AIStream", "LRUResponseCache", "ResponseCacheBackend", "SemanticCache",
     "AIClientError", "AIProviderError", "AIRateLimitError", 
     "AIAuthenticationError", "AIModelNotFoundError", "AIQuotaExceededError"
 ]
\ No newline at end of file
@@ -2,21 +2,140 @@
 Anthropic Claude provider implementation using the official SDK.
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import os
-from typing import List, Optional, Dict, Any
-import anthropic
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Dict, Any, Mapping, Tuple, Union
 
-from .base import BaseAIProvider, AIMessage, AIResponse
+from .base import BaseAIProvider, AIMessage, AIResponse, AIStream
+from .cache import LRUResponseCache, ResponseCacheBackend, SemanticCache
 from .exceptions import (
     AIProviderError, AIRateLimitError, AIAuthenticationError, 
     AIModelNotFoundError, AIQuotaExceededError
 )
 
+if TYPE_CHECKING:
+    import httpx
+
+
+_AVAILABLE_MODELS: Tuple[str, ...] = (
+    "claude-sonnet-4-20250514",
+    "claude-3-5-sonnet-20241022",
+    "claude-3-5-haiku-20241022",
+    "claude-3-opus-20240229",
+    "claude-3-sonnet-20240229",
+    "claude-3-haiku-20240307",
+)
+_AVAILABLE_MODELS_JOINED = ", ".join(_AVAILABLE_MODELS)
+
+# Shared, read-only usage for responses that carry no usage information
+_ZERO_USAGE: Mapping[str, int] = MappingProxyType({
+    "prompt_tokens": 0,
+    "completion_tokens": 0,
+    "total_tokens": 0,
+    "cache_read_input_tokens": 0,
+    "cache_creation_input_tokens": 0,
+})
+
+# Connection pool sizing for the process-wide HTTP clients
+_MAX_CONNECTIONS = 100
+_MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+# The SDK (and httpx/pydantic under it) is imported on first use so that
+# importing ai_client for its types and exceptions stays cheap
+@functools.cache
+def _anthropic():
+    import anthropic
+    return anthropic
+
+
+@functools.cache
+def _httpx():
+    import httpx
+    return httpx
+
+
+@functools.cache
+def _http_limits() -> "httpx.Limits":
+    return _httpx().Limits(
+        max_connections=_MAX_CONNECTIONS,
+        max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS
+    )
+
+
+@functools.cache
+def _exc_map() -> Dict[type, Tuple[type, str]]:
+    """Anthropic SDK errors mapped to client errors, most specific first"""
+    sdk = _anthropic()
+    return {
+        sdk.RateLimitError: (AIRateLimitError, "Anthropic rate limit exceeded"),
+        sdk.AuthenticationError: (AIAuthenticationError, "Anthropic authentication failed"),
+        sdk.NotFoundError: (AIProviderError, "Anthropic API error"),
+        sdk.BadRequestError: (AIProviderError, "Anthropic bad request"),
+        sdk.APIError: (AIProviderError, "Anthropic API error"),
+    }
+
+
+def _cached_text_block(text: str) -> Dict[str, Any]:
+    """Text content block marked as a prompt-cache breakpoint"""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+class _AnthropicStream(AIStream):
+    """Text stream over a single Anthropic Messages API request"""
+    
+    def __init__(self, provider: "AnthropicProvider", params: Dict[str, Any], model: str):
+        super().__init__()
+        self._provider = provider
+        self._params = params
+        self._model = model
+    
+    async def _iter_text(self) -> AsyncIterator[str]:
+        provider = self._provider
+        
+        # A cached response arrives as a single chunk
+        cache_key = provider._cache_key(self._params) if provider.cache is not None else None
+        cached = provider._cached_response(cache_key)
+        if cached is not None:
+            self.response = cached
+            if self.response.content:
+                yield self.response.content
+            return
+        
+        try:
+            async with provider.async_client.messages.stream(**self._params) as stream:
+                async for text in stream.text_stream:
+                    yield text
+                final = await stream.get_final_message()
+        except Exception as e:
+            raise provider._wrap_error(e, self._model) from e
+        
+        self.response = provider._to_response(final, cache_key)
+
 
 class AnthropicProvider(BaseAIProvider):
     """Anthropic Claude provider implementation using async client."""
     
-    def __init__(self, api_key: Optional[str] = None, **config):
+    # HTTP clients shared by every provider that isn't given its own, so
+    # TCP/TLS connections are reused across instances
+    _shared_async_http: Optional["httpx.AsyncClient"] = None
+    _shared_sync_http: Optional["httpx.Client"] = None
+    _shared_http_lock = threading.Lock()
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[ResponseCacheBackend] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        sync_http_client: Optional["httpx.Client"] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        **config
+    ):
         super().__init__(api_key, **config)
         
         # Use provided API key or fall back to environment variable
@@ -24,26 +143,84 @@ class AnthropicProvider(BaseAIProvider):
         if not key:
             raise ValueError("Anthropic API key is required. Set ANTHROPIC_API_KEY or pass api_key parameter.")
         
+        self._async_http = http_client or self._get_shared_async_http()
+        self._sync_http = sync_http_client or self._get_shared_sync_http()
+        # Only clients passed in are this provider's to close; the shared
+        # pools outlive it (see aclose_shared)
+        self._owns_async_http = http_client is not None
+        self._owns_sync_http = sync_http_client is not None
+        
+        sdk = _anthropic()
+        # The SDK retries transient failures itself, honoring Retry-After
+        max_retries = config.get("max_retries", 3)
         # Use async client for async operations
-        self.async_client = anthropic.AsyncAnthropic(api_key=key)
+        self.async_client = sdk.AsyncAnthropic(
+            api_key=key, http_client=self._async_http, max_retries=max_retries
+        )
         # Keep sync client for sync operations
-        self.sync_client = anthropic.Anthropic(api_key=key)
+        self.sync_client = sdk.Anthropic(
+            api_key=key, http_client=self._sync_http, max_retries=max_retries
+        )
         self._default_model = config.get("default_model", "claude-3-5-haiku-20241022")
+        # Optional: memoize responses for identical requests (any backend
+        # with get/set, or an in-memory LRU of cache_size entries). Off by
+        # default: sampled replies would otherwise repeat verbatim
+        if cache is None and config.get("cache_size"):
+            cache = LRUResponseCache(maxsize=config["cache_size"])
+        self.cache = cache
+        # Optional: also serve paraphrases of earlier requests
+        self.semantic_cache = semantic_cache
+        self.similarity_threshold = config.get("similarity_threshold", 0.92)
+    
+    @classmethod
+    def _get_shared_async_http(cls) -> "httpx.AsyncClient":
+        """Get or create the process-wide async HTTP client"""
+        with cls._shared_http_lock:
+            if cls._shared_async_http is None or cls._shared_async_http.is_closed:
+                cls._shared_async_http = _httpx().AsyncClient(limits=_http_limits())
+            return cls._shared_async_http
+    
+    @classmethod
+    def _get_shared_sync_http(cls) -> "httpx.Client":
+        """Get or create the process-wide sync HTTP client"""
+        with cls._shared_http_lock:
+            if cls._shared_sync_http is None or cls._shared_sync_http.is_closed:
+                cls._shared_sync_http = _httpx().Client(limits=_http_limits())
+            return cls._shared_sync_http
+    
+    async def aclose(self) -> None:
+        """Close the HTTP clients this provider was given
+        
+        The process-wide pools are left open for the other providers using
+        them; close those with aclose_shared on shutdown.
+        """
+        if self._owns_async_http:
+            await self._async_http.aclose()
+        if self._owns_sync_http:
+            self._sync_http.close()
+    
+    @classmethod
+    async def aclose_shared(cls) -> None:
+        """Close the process-wide HTTP connection pools
+        
+        Call once on shutdown: providers created before this keep their
+        closed clients.
+        """
+        with cls._shared_http_lock:
+            async_http, cls._shared_async_http = cls._shared_async_http, None
+            sync_http, cls._shared_sync_http = cls._shared_sync_http, None
+        if async_http is not None:
+            await async_http.aclose()
+        if sync_http is not None:
+            sync_http.close()
     
     @property
     def default_model(self) -> str:
         return self._default_model
     
     @property
-    def available_models(self) -> List[str]:
-        return [
-            "claude-sonnet-4-20250514",
-            "claude-3-5-sonnet-20241022",
-            "claude-3-5-haiku-20241022", 
-            "claude-3-opus-20240229",
-            "claude-3-sonnet-20240229",
-            "claude-3-haiku-20240307"
-        ]
+    def available_models(self) -> Tuple[str, ...]:
+        return _AVAILABLE_MODELS
     
     async def generate(
         self,
@@ -54,111 +231,31 @@ class AnthropicProvider(BaseAIProvider):
         **kwargs
     ) -> AIResponse:
         """Generate response asynchronously using Anthropic's async client."""
-        # Separate system message from conversation messages
-        system_prompt, conversation_messages = self._separate_system_message(messages)
+        params, model = self._build_params(messages, model, max_tokens, temperature, kwargs)
         
-        # Set defaults
-        model = model or self.default_model
-        max_tokens = max_tokens or 1024
-        
-        # Build request parameters
-        params: Dict[str, Any] = {
-            "model": model,
-            "max_tokens": max_tokens,
-            "messages": conversation_messages,
-        }
+        # Serve repeated requests from the response cache
+        cache_key = self._cache_key(params) if self.cache is not None else None
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
         
-        # Add system prompt if present
-        if system_prompt:
-            params["system"] = system_prompt
-        
-        # Add optional parameters if provided
-        if temperature is not None:
-            params["temperature"] = temperature
-        
-        # Add any additional kwargs passed through
-        params.update(kwargs)
+        semantic = None
+        probe = self._semantic_probe(params)
+        if probe is not None:
+            text, context = probe
+            # Embedding may be CPU-bound or a network call of its own
+            query = await asyncio.to_thread(self.semantic_cache.embed, text)
+            cached = self.semantic_cache.get(query, context, self.similarity_threshold)
+            if cached is not None:
+                return self._from_entry(cached)
+            semantic = (query, context)
         
         try:
             # Call Anthropic API using async client
             response = await self.async_client.messages.create(**params)
-            
-            # Extract content from response
-            content = ""
-            if response.content:
-                # Anthropic returns content as a list of content blocks
-                content = "".join(
-                    block.text if hasattr(block, 'text') else str(block) 
-                    for block in response.content
-                )
-            
-            # Extract usage information
-            usage_info = self._extract_usage_info(response)
-            
-            return AIResponse(
-                content=content,
-                model=response.model,
-                usage=usage_info,
-                raw_response=response
-            )
-            
-        except anthropic.RateLimitError as e:
-            raise AIRateLimitError(
-                f"Anthropic rate limit exceeded: {str(e)}", 
-                provider="anthropic",
-                original_error=e,
-                status_code=getattr(e, 'status_code', None)
-            ) from e
-        except anthropic.AuthenticationError as e:
-            raise AIAuthenticationError(
-                f"Anthropic authentication failed: {str(e)}", 
-                provider="anthropic",
-                original_error=e,
-                status_code=getattr(e, 'status_code', None)
-            ) from e
-        except anthropic.NotFoundError as e:
-            if "model" in str(e).lower():
-                raise AIModelNotFoundError(
-                    f"Model not found: {model}. Available models: {', '.join(self.available_models)}", 
-                    provider="anthropic",
-                    original_error=e,
-                    status_code=getattr(e, 'status_code', None)
-                ) from e
-            else:
-                raise AIProviderError(
-                    f"Anthropic API error: {str(e)}", 
-                    provider="anthropic",
-                    original_error=e,
-                    status_code=getattr(e, 'status_code', None)
-                ) from e
-        except anthropic.BadRequestError as e:
-            if "quota" in str(e).lower() or "limit" in str(e).lower():
-                raise AIQuotaExceededError(
-                    f"Anthropic quota exceeded: {str(e)}", 
-                    provider="anthropic",
-                    original_error=e,
-                    status_code=getattr(e, 'status_code', None)
-                ) from e
-            else:
-                raise AIProviderError(
-                    f"Anthropic bad request: {str(e)}", 
-                    provider="anthropic",
-                    original_error=e,
-                    status_code=getattr(e, 'status_code', None)
-                ) from e
-        except anthropic.APIError as e:
-            raise AIProviderError(
-                f"Anthropic API error: {str(e)}", 
-                provider="anthropic",
-                original_error=e,
-                status_code=getattr(e, 'status_code', None)
-            ) from e
+            return self._to_response(response, cache_key, semantic)
         except Exception as e:
-            raise AIProviderError(
-                f"Unexpected error from Anthropic: {str(e)}", 
-                provider="anthropic",
-                original_error=e
-            ) from e
+            raise self._wrap_error(e, model) from e
     
     def generate_sync(
         self,
@@ -169,6 +266,61 @@ class AnthropicProvider(BaseAIProvider):
         **kwargs
     ) -> AIResponse:
         """Generate response synchronously."""
+        params, model = self._build_params(messages, model, max_tokens, temperature, kwargs)
+        
+        # Serve repeated requests from the response cache
+        cache_key = self._cache_key(params) if self.cache is not None else None
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
+        semantic = None
+        probe = self._semantic_probe(params)
+        if probe is not None:
+            text, context = probe
+            query = self.semantic_cache.embed(text)
+            cached = self.semantic_cache.get(query, context, self.similarity_threshold)
+            if cached is not None:
+                return self._from_entry(cached)
+            semantic = (query, context)
+        
+        try:
+            # Call Anthropic API
+            response = self.sync_client.messages.create(**params)
+            return self._to_response(response, cache_key, semantic)
+        except Exception as e:
+            raise self._wrap_error(e, model) from e
+    
+    def generate_stream(
+        self,
+        messages: List[AIMessage],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> AIStream:
+        """Stream a response using Anthropic's streaming Messages API.
+        
+        The request is sent when iteration starts; the complete response is
+        available on the stream's `response` afterwards and is cached like
+        a generate result.
+        """
+        params, model = self._build_params(messages, model, max_tokens, temperature, kwargs)
+        return _AnthropicStream(self, params, model)
+    
+    def _build_params(
+        self,
+        messages: List[AIMessage],
+        model: Optional[str],
+        max_tokens: Optional[int],
+        temperature: Optional[float],
+        kwargs: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], str]:
+        """Build Messages API request parameters
+        
+        Returns:
+            Tuple of (params, model used for the request)
+        """
         # Separate system message from conversation messages
         system_prompt, conversation_messages = self._separate_system_message(messages)
         
@@ -194,81 +346,145 @@ class AnthropicProvider(BaseAIProvider):
         # Add any additional kwargs passed through
         params.update(kwargs)
         
-        try:
-            # Call Anthropic API
-            response = self.sync_client.messages.create(**params)
-            
-            # Extract content from response
-            content = ""
-            if response.content:
-                content = "".join(
-                    block.text if hasattr(block, 'text') else str(block) 
-                    for block in response.content
-                )
-            
-            # Extract usage information
-            usage_info = self._extract_usage_info(response)
-            
-            return AIResponse(
-                content=content,
-                model=response.model,
-                usage=usage_info,
-                raw_response=response
-            )
-            
-        except anthropic.RateLimitError as e:
-            raise AIRateLimitError(
-                f"Anthropic rate limit exceeded: {str(e)}", 
+        return params, model
+    
+    def _to_response(
+        self,
+        response,
+        cache_key: Optional[str],
+        semantic: Optional[Tuple[Any, str]] = None
+    ) -> AIResponse:
+        """Convert an Anthropic message into an AIResponse and cache it
+        
+        Args:
+            response: Anthropic message
+            cache_key: Exact-match cache key of the request, None when
+                the response cache is off
+            semantic: (query embedding, context key) to also store the
+                response in the semantic cache
+        """
+        content = self._extract_text(response.content)
+        usage_info = self._extract_usage_info(response)
+        
+        # raw_response is not cached: SDK objects are not safely shareable
+        entry = {
+            "content": content,
+            "model": response.model,
+            "usage": usage_info,
+        }
+        if cache_key is not None:
+            self.cache.set(cache_key, entry)
+        if semantic is not None:
+            query, context = semantic
+            self.semantic_cache.put(query, entry, context)
+        
+        return AIResponse(
+            content=content,
+            model=response.model,
+            usage=usage_info,
+            raw_response=response
+        )
+    
+    def _cached_response(self, cache_key: Optional[str]) -> Optional[AIResponse]:
+        """Look a request up in the response cache"""
+        if cache_key is None:
+            return None
+        entry = self.cache.get(cache_key)
+        return self._from_entry(entry) if entry is not None else None
+    
+    @staticmethod
+    def _from_entry(entry: Dict[str, Any]) -> AIResponse:
+        """Build a response from cached fields
+        
+        The usage mapping is copied: the entry is shared by every caller
+        the cache serves.
+        """
+        return AIResponse(
+            content=entry["content"],
+            model=entry["model"],
+            usage=dict(entry["usage"]) if entry["usage"] is not None else None
+        )
+    
+    def _wrap_error(self, e: Exception, model: str) -> AIProviderError:
+        """Translate an exception raised during a request into a client error"""
+        message = str(e)
+        lowered = message.lower()
+        status_code = getattr(e, 'status_code', None)
+        sdk = _anthropic()
+        
+        if isinstance(e, sdk.NotFoundError) and "model" in lowered:
+            return AIModelNotFoundError(
+                f"Model not found: {model}. Available models: {_AVAILABLE_MODELS_JOINED}", 
                 provider="anthropic",
                 original_error=e,
-                status_code=getattr(e, 'status_code', None)
-            ) from e
-        except anthropic.AuthenticationError as e:
-            raise AIAuthenticationError(
-                f"Anthropic authentication failed: {str(e)}", 
+                status_code=status_code
+            )
+        if isinstance(e, sdk.BadRequestError) and ("quota" in lowered or "limit" in lowered):
+            return AIQuotaExceededError(
+                f"Anthropic quota exceeded: {message}", 
                 provider="anthropic",
                 original_error=e,
-                status_code=getattr(e, 'status_code', None)
-            ) from e
-        except anthropic.NotFoundError as e:
-            if "model" in str(e).lower():
-                raise AIModelNotFoundError(
-                    f"Model not found: {model}. Available models: {', '.join(self.available_models)}", 
-                    provider="anthropic",
-                    original_error=e,
-                    status_code=getattr(e, 'status_code', None)
-                ) from e
-            else:
-                raise AIProviderError(
-                    f"Anthropic API error: {str(e)}", 
+                status_code=status_code
+            )
+        
+        for error_type, (wrapper, prefix) in _exc_map().items():
+            if isinstance(e, error_type):
+                return wrapper(
+                    f"{prefix}: {message}", 
                     provider="anthropic",
                     original_error=e,
-                    status_code=getattr(e, 'status_code', None)
-                ) from e
-        except anthropic.BadRequestError as e:
-            raise AIProviderError(
-                f"Anthropic bad request: {str(e)}", 
-                provider="anthropic",
-                original_error=e,
-                status_code=getattr(e, 'status_code', None)
-            ) from e
-        except anthropic.APIError as e:
-            raise AIProviderError(
-                f"Anthropic API error: {str(e)}", 
-                provider="anthropic",
-                original_error=e,
-                status_code=getattr(e, 'status_code', None)
-            ) from e
-        except Exception as e:
-            raise AIProviderError(
-                f"Unexpected error from Anthropic: {str(e)}", 
-                provider="anthropic",
-                original_error=e
-            ) from e
+                    status_code=status_code
+                )
+        
+        return AIProviderError(
+            f"Unexpected error from Anthropic: {message}", 
+            provider="anthropic",
+            original_error=e
+        )
+    
+    @staticmethod
+    def _extract_text(content) -> str:
+        """Join the text of Anthropic's content blocks into a single string"""
+        if not content:
+            return ""
+        if len(content) == 1:
+            # Common case: a single text block
+            text = getattr(content[0], "text", None)
+            return text if text is not None else str(content[0])
+        parts = []
+        for block in content:
+            text = getattr(block, "text", None)
+            parts.append(text if text is not None else str(block))
+        return "".join(parts)
+    
+    def _semantic_probe(self, params: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+        """Split a request into (last user message, context key) for the
+        semantic cache, or None when it doesn't apply
+        
+        The context key covers everything else in the request, so a hit
+        only differs from the original request in the phrasing of the
+        final user message.
+        """
+        if self.semantic_cache is None:
+            return None
+        messages = params["messages"]
+        if not messages or messages[-1]["role"] != "user":
+            return None
+        text = messages[-1]["content"]
+        if not isinstance(text, str):
+            return None
+        context = self._cache_key({**params, "messages": messages[:-1]})
+        return text, context
+    
+    @staticmethod
+    def _cache_key(params: Dict[str, Any]) -> str:
+        """Build a stable SHA-256 digest of the normalized request parameters"""
+        payload = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
     
     def _separate_system_message(
         self, messages: List[AIMessage]
-    ) -> tuple[Optional[str], List[Dict[str, str]]]:
+    ) -> tuple[Union[str, List[Dict[str, Any]], None], List[Dict[str, Any]]]:
         """Separate system message from conversation messages.
         
         Anthropic API requires system prompt as a separate parameter,
@@ -277,26 +493,52 @@ class AnthropicProvider(BaseAIProvider):
         Returns:
             Tuple of (system_prompt, conversation_messages)
         """
-        system_prompt = None
-        conversation_messages = []
-        
-        for msg in messages:
-            if msg.role == "system":
-                system_prompt = msg.content
-            else:
-                conversation_messages.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
-        
-        return system_prompt, conversation_messages
+        # By convention the system prompt comes first
+        if messages and messages[0].role == "system":
+            system_message = messages[0]
+            rest = messages[1:]
+        else:
+            system_message = None
+            rest = messages
+        
+        conversation_messages = [
+            self._message_param(msg) for msg in rest if msg.role != "system"
+        ]
+        
+        # Rare: system messages further down the list; the last one wins
+        if len(conversation_messages) != len(rest):
+            system_message = next(msg for msg in reversed(rest) if msg.role == "system")
+        
+        if system_message is None:
+            return None, conversation_messages
+        if system_message.cache:
+            return [_cached_text_block(system_message.content)], conversation_messages
+        return system_message.content, conversation_messages
     
-    def _extract_usage_info(self, response) -> Dict[str, Any]:
+    @staticmethod
+    def _message_param(msg: AIMessage) -> Dict[str, Any]:
+        """Messages API form of a message, as a cache breakpoint if marked"""
+        if msg.cache:
+            # Built fresh: the memoized to_dict form is shared
+            return {"role": msg.role, "content": [_cached_text_block(msg.content)]}
+        return msg.to_dict()
+    
+    def _extract_usage_info(self, response) -> Mapping[str, Any]:
         """Extract usage information from Anthropic response"""
-        if hasattr(response, 'usage'):
-            return {
-                "prompt_tokens": getattr(response.usage, 'input_tokens', 0),
-                "completion_tokens": getattr(response.usage, 'output_tokens', 0),
-                "total_tokens": getattr(response.usage, 'input_tokens', 0) + getattr(response.usage, 'output_tokens', 0)
-            }
-        return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        usage = getattr(response, 'usage', None)
+        if usage is None:
+            return _ZERO_USAGE
+        prompt_tokens = getattr(usage, 'input_tokens', 0)
+        completion_tokens = getattr(usage, 'output_tokens', 0)
+        # Prompt-cache activity, reported separately: input_tokens excludes
+        # both, so prompt and total tokens count uncached input only. None
+        # when the request had no cache breakpoint
+        cache_read = getattr(usage, 'cache_read_input_tokens', None) or 0
+        cache_creation = getattr(usage, 'cache_creation_input_tokens', None) or 0
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "cache_read_input_tokens": cache_read,
+            "cache_creation_input_tokens": cache_creation,
+        }
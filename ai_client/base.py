@@ -2,19 +2,36 @@
 Base interfaces and types for AI client abstraction
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any, Protocol, runtime_checkable
+from dataclasses import dataclass, field
+from typing import (
+    AsyncIterator, Awaitable, Callable, List, Optional, Dict, Any, Mapping,
+    Protocol, Sequence, Union
+)
 
 
-@dataclass
+_VALID_ROLES = frozenset({"user", "assistant", "system"})
+
+
+@dataclass(slots=True)
 class AIMessage:
     """Represents a message in a conversation"""
     role: str  # "user", "assistant", "system"
     content: str
+    # Ask the provider to cache the prompt prefix ending with this message
+    cache: bool = False
+    _dict: Optional[Dict[str, str]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, str]:
-        return {"role": self.role, "content": self.content}
+        """Return the API dict form of the message
+        
+        The dict is built once and shared between calls, so callers must
+        not mutate it.
+        """
+        if self._dict is None:
+            self._dict = {"role": self.role, "content": self.content}
+        return self._dict
 
 
 @dataclass
@@ -22,7 +39,7 @@ class AIResponse:
     """Standardized response from any AI provider"""
     content: str
     model: str
-    usage: Optional[Dict[str, Any]] = None
+    usage: Optional[Mapping[str, Any]] = None
     raw_response: Optional[Any] = None
     
     @property
@@ -31,11 +48,42 @@ class AIResponse:
         return self.content
 
 
-@runtime_checkable
+class AIStream(ABC):
+    """Incremental response from an AI provider
+    
+    Iterate with `async for` to receive text chunks as they are generated.
+    Once iteration finishes, `response` holds the complete AIResponse
+    (content and usage), as generate would have returned it.
+    """
+    
+    def __init__(self):
+        self.response: Optional[AIResponse] = None
+    
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self._iter_text()
+    
+    @abstractmethod
+    def _iter_text(self) -> AsyncIterator[str]:
+        """Yield text chunks, setting `response` when the stream ends"""
+        ...
+
+
+class _BufferedStream(AIStream):
+    """Stream for providers without native streaming: one chunk, at the end"""
+    
+    def __init__(self, generate: Callable[[], Awaitable[AIResponse]]):
+        super().__init__()
+        self._generate = generate
+    
+    async def _iter_text(self) -> AsyncIterator[str]:
+        self.response = await self._generate()
+        if self.response.content:
+            yield self.response.content
+
+
 class AIProvider(Protocol):
     """Protocol defining the interface all AI providers must implement"""
     
-    @abstractmethod
     async def generate(
         self,
         messages: List[AIMessage],
@@ -47,7 +95,6 @@ class AIProvider(Protocol):
         """Generate a response from the AI provider"""
         ...
     
-    @abstractmethod
     def generate_sync(
         self,
         messages: List[AIMessage],
@@ -59,16 +106,39 @@ class AIProvider(Protocol):
         """Synchronous version of generate"""
         ...
     
+    def generate_stream(
+        self,
+        messages: List[AIMessage],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> AIStream:
+        """Stream a response from the AI provider as it is generated"""
+        ...
+    
+    async def generate_many(
+        self,
+        batch: Sequence[List[AIMessage]],
+        *,
+        concurrency: Optional[int] = None,
+        **kwargs
+    ) -> List[Union[AIResponse, BaseException]]:
+        """Generate responses for several conversations concurrently"""
+        ...
+    
+    async def aclose(self) -> None:
+        """Release network resources held by the provider"""
+        ...
+    
     @property
-    @abstractmethod
     def default_model(self) -> str:
         """Return the default model for this provider"""
         ...
     
     @property
-    @abstractmethod
-    def available_models(self) -> List[str]:
-        """Return list of available models for this provider"""
+    def available_models(self) -> Sequence[str]:
+        """Return the available models for this provider"""
         ...
 
 
@@ -79,15 +149,24 @@ class BaseAIProvider(ABC):
         self.api_key = api_key
         self.config = config
     
+    async def __aenter__(self) -> "BaseAIProvider":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Release network resources held by the provider"""
+        pass
+    
     def _validate_messages(self, messages: List[AIMessage]) -> None:
         """Validate message format"""
         if not messages:
             raise ValueError("Messages list cannot be empty")
         
-        valid_roles = {"user", "assistant", "system"}
         for msg in messages:
-            if msg.role not in valid_roles:
-                raise ValueError(f"Invalid role: {msg.role}. Must be one of {valid_roles}")
+            if msg.role not in _VALID_ROLES:
+                raise ValueError(f"Invalid role: {msg.role}. Must be one of {set(_VALID_ROLES)}")
             if not msg.content.strip():
                 raise ValueError("Message content cannot be empty")
     
@@ -104,4 +183,45 @@ class BaseAIProvider(ABC):
     @abstractmethod
     def generate_sync(self, messages: List[AIMessage], **kwargs) -> AIResponse:
         """Synchronous version of generate"""
-        pass
\ No newline at end of file
+        pass
+    
+    def generate_stream(self, messages: List[AIMessage], **kwargs) -> AIStream:
+        """Stream a response from the AI provider as it is generated
+        
+        Providers without native streaming inherit this fallback, which
+        yields the whole response from generate as a single chunk.
+        """
+        return _BufferedStream(lambda: self.generate(messages, **kwargs))
+    
+    async def generate_many(
+        self,
+        batch: Sequence[List[AIMessage]],
+        *,
+        concurrency: Optional[int] = None,
+        **kwargs
+    ) -> List[Union[AIResponse, BaseException]]:
+        """Generate responses for several conversations concurrently
+        
+        Requests overlap on the network but at most `concurrency` are in
+        flight at once (defaults to the `max_concurrency` config, 10).
+        
+        Args:
+            batch: One message list per request
+            concurrency: Maximum number of simultaneous requests
+            **kwargs: Passed through to generate for every request
+            
+        Returns:
+            Responses in the same order as batch; a failed request yields
+            its exception instead of raising
+        """
+        limit = concurrency or self.config.get("max_concurrency", 10)
+        semaphore = asyncio.Semaphore(limit)
+        
+        async def generate_one(messages: List[AIMessage]) -> AIResponse:
+            async with semaphore:
+                return await self.generate(messages, **kwargs)
+        
+        return await asyncio.gather(
+            *(generate_one(messages) for messages in batch),
+            return_exceptions=True
+        )
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""
+Response caching for AI client providers
+"""
+
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Protocol, Sequence
+
+if TYPE_CHECKING:
+    import numpy
+
+
+class ResponseCacheBackend(Protocol):
+    """Interface for pluggable response cache backends"""
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached response fields for key, or None on miss"""
+        ...
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store response fields under key"""
+        ...
+
+
+class LRUResponseCache:
+    """Thread-safe in-memory LRU cache of provider responses
+
+    Values are plain dicts of AIResponse fields (content, model, usage) so
+    they can be safely shared between callers and backends.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+@functools.cache
+def _numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "SemanticCache requires numpy. Install with: pip install 'alain[semantic]'"
+        ) from e
+    return numpy
+
+
+def _context_id(context: str) -> int:
+    """Reduce a context key to a 64-bit id for vectorized comparison"""
+    return int.from_bytes(hashlib.blake2b(context.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class SemanticCache:
+    """In-process cache of responses keyed by meaning rather than exact text
+
+    Queries are embedded with a caller-supplied function (for example a
+    local sentence-transformers model's `encode`) and L2-normalized, so a
+    lookup is one matrix-vector product against all stored embeddings.
+    Entries only match queries with the same context key (everything in the
+    request besides the query text), and only until their ttl, if given,
+    runs out. The oldest entry is overwritten once maxsize is reached.
+
+    Requires numpy (the `semantic` extra).
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        threshold: float = 0.92,
+        maxsize: int = 1000,
+    ):
+        np = _numpy()
+        self._embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        # Row-per-entry embedding matrix, allocated once the dimension is known
+        self._vectors: Optional["numpy.ndarray"] = None
+        self._contexts = np.zeros(max(maxsize, 0), dtype=np.uint64)
+        # time.monotonic() deadline per entry; inf for entries without a ttl
+        self._expires = np.full(max(maxsize, 0), np.inf)
+        self._responses: List[Optional[Dict[str, Any]]] = [None] * max(maxsize, 0)
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def embed(self, text: str) -> "numpy.ndarray":
+        """Embed text as an L2-normalized vector"""
+        np = _numpy()
+        vector = np.asarray(self._embed(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def get(
+        self,
+        query_emb: "numpy.ndarray",
+        context: str = "",
+        threshold: Optional[float] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the response of the most similar unexpired stored query if
+        it is at least threshold similar (cosine), else None"""
+        np = _numpy()
+        threshold = self.threshold if threshold is None else threshold
+        context_id = np.uint64(_context_id(context))
+        with self._lock:
+            if self._vectors is None or self._size == 0:
+                return None
+            n = self._size
+            similarities = self._vectors[:n] @ query_emb
+            similarities[self._contexts[:n] != context_id] = -np.inf
+            similarities[self._expires[:n] <= time.monotonic()] = -np.inf
+            best = int(np.argmax(similarities))
+            if similarities[best] < threshold:
+                return None
+            return self._responses[best]
+
+    def put(
+        self,
+        query_emb: "numpy.ndarray",
+        response: Dict[str, Any],
+        context: str = "",
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Store response fields under an embedded query, for ttl seconds
+        if given"""
+        if self.maxsize <= 0:
+            return
+        np = _numpy()
+        context_id = _context_id(context)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.maxsize, query_emb.shape[0]), dtype=np.float32)
+            slot = self._next
+            self._vectors[slot] = query_emb
+            self._contexts[slot] = context_id
+            self._expires[slot] = np.inf if ttl is None else time.monotonic() + ttl
+            self._responses[slot] = response
+            self._next = (slot + 1) % self.maxsize
+            self._size = min(self._size + 1, self.maxsize)
+
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        with self._lock:
+            self._responses = [None] * max(self.maxsize, 0)
+            self._size = 0
+            self._next = 0
+
+    def __len__(self) -> int:
+        return self._size
@@ -4,7 +4,7 @@ Configuration management for AI client providers
 
 import os
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
 from enum import Enum
 
 
@@ -16,6 +16,10 @@ class ProviderType(Enum):
     # GOOGLE = "google"
 
 
+# Name -> member lookup that skips Enum.__call__
+_PROVIDER_BY_NAME: Dict[str, ProviderType] = {p.value: p for p in ProviderType}
+
+
 @dataclass
 class ProviderConfig:
     """Configuration for a specific AI provider"""
@@ -45,22 +49,32 @@ class AIClientConfig:
     
     @classmethod
     def from_env(cls) -> "AIClientConfig":
-        """Create configuration from environment variables"""
-        config = cls()
+        """Create configuration from environment variables
         
-        # Determine default provider from environment
-        provider_name = os.getenv("AI_PROVIDER", "anthropic").lower()
-        try:
-            config.default_provider = ProviderType(provider_name)
-        except ValueError:
-            config.default_provider = ProviderType.ANTHROPIC
+        The variables are read once per process, as soon as an API key is
+        set, and each call builds a new config from them; call
+        invalidate_env_cache() after changing them.
+        """
+        env = _read_env()
+        config = cls()
+        config.default_provider = _PROVIDER_BY_NAME.get(env.provider_name, ProviderType.ANTHROPIC)
         
         # Load configuration for available providers
-        if os.getenv("ANTHROPIC_API_KEY"):
-            config.providers[ProviderType.ANTHROPIC] = ProviderConfig.from_env(ProviderType.ANTHROPIC)
+        if env.anthropic_api_key:
+            config.providers[ProviderType.ANTHROPIC] = ProviderConfig(
+                provider_type=ProviderType.ANTHROPIC,
+                api_key=env.anthropic_api_key,
+                default_model=env.anthropic_default_model,
+            )
         
         return config
     
+    @staticmethod
+    def invalidate_env_cache() -> None:
+        """Forget the cached environment variables so from_env re-reads them"""
+        global _env_cache
+        _env_cache = None
+    
     def get_provider_config(self, provider_type: Optional[ProviderType] = None) -> ProviderConfig:
         """Get configuration for a specific provider, defaulting to the default provider"""
         provider = provider_type or self.default_provider
@@ -68,4 +82,33 @@ class AIClientConfig:
         if provider not in self.providers:
             raise ValueError(f"Provider {provider.value} is not configured. Check your API keys.")
         
-        return self.providers[provider]
\ No newline at end of file
+        return self.providers[provider]
+
+
+class _EnvSnapshot(NamedTuple):
+    """The environment variables AIClientConfig is built from"""
+    provider_name: str
+    anthropic_api_key: Optional[str]
+    anthropic_default_model: str
+
+
+_env_cache: Optional[_EnvSnapshot] = None
+
+
+def _read_env() -> _EnvSnapshot:
+    """Read the config environment variables, cached once a key is set
+    
+    A snapshot without an API key isn't cached: it may have been taken
+    before load_dotenv() ran.
+    """
+    global _env_cache
+    if _env_cache is not None:
+        return _env_cache
+    env = _EnvSnapshot(
+        provider_name=os.getenv("AI_PROVIDER", "anthropic").lower(),
+        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
+        anthropic_default_model=os.getenv("ANTHROPIC_DEFAULT_MODEL", "claude-3-5-sonnet-20241022"),
+    )
+    if env.anthropic_api_key:
+        _env_cache = env
+    return env
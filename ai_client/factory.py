@@ -2,19 +2,65 @@
 Factory for creating AI provider instances
 """
 
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Hashable, List
 from .base import AIProvider
-from .config import AIClientConfig, ProviderType, ProviderConfig
-from .anthropic import AnthropicProvider
+from .config import AIClientConfig, ProviderType, ProviderConfig, _PROVIDER_BY_NAME
+
+
+def _config_cache_key(provider_type: ProviderType, config: Dict[str, Any]) -> Optional[Hashable]:
+    """Build a cache key for a provider configuration
+    
+    Returns None when a config value is unhashable, meaning the instance
+    can't be cached.
+    """
+    key = (provider_type, frozenset(config.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class _ProviderLRU:
+    """Small LRU map of provider instances keyed by frozen configuration"""
+    
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, AIProvider]" = OrderedDict()
+    
+    def get(self, key: Optional[Hashable]) -> Optional[AIProvider]:
+        if key is None or key not in self._data:
+            return None
+        self._data.move_to_end(key)
+        return self._data[key]
+    
+    def put(self, key: Optional[Hashable], instance: AIProvider) -> None:
+        if key is None:
+            return
+        self._data[key] = instance
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def values(self) -> List[AIProvider]:
+        return list(self._data.values())
+    
+    def clear(self) -> None:
+        self._data.clear()
 
 
 class AIClientFactory:
     """Factory for creating and managing AI provider instances"""
     
+    # Providers built by create_quick, shared process-wide so repeated
+    # create_ai_client() calls reuse the same instances and connection pools
+    _quick_cache = _ProviderLRU()
+    
     def __init__(self, config: Optional[AIClientConfig] = None):
         """Initialize with configuration"""
         self.config = config or AIClientConfig.from_env()
-        self._provider_cache: Dict[ProviderType, AIProvider] = {}
+        self._provider_cache = _ProviderLRU()
     
     def create_provider(
         self, 
@@ -35,10 +81,11 @@ class AIClientFactory:
         """
         provider = provider_type or self.config.default_provider
         
-        # Check cache first
-        cache_key = provider
-        if cache_key in self._provider_cache and not override_config:
-            return self._provider_cache[cache_key]
+        # Check cache first (keyed on the overrides too)
+        cache_key = _config_cache_key(provider, override_config)
+        cached = self._provider_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         # Get provider configuration
         provider_config = self.config.get_provider_config(provider)
@@ -49,9 +96,8 @@ class AIClientFactory:
         # Create provider instance
         instance = self._create_provider_instance(provider, provider_config, final_config)
         
-        # Cache if no overrides were used
-        if not override_config:
-            self._provider_cache[cache_key] = instance
+        # Cache unless the overrides were unhashable
+        self._provider_cache.put(cache_key, instance)
             
         return instance
     
@@ -63,6 +109,8 @@ class AIClientFactory:
     ) -> AIProvider:
         """Create the actual provider instance"""
         if provider_type == ProviderType.ANTHROPIC:
+            # Imported lazily so the SDK only loads when a provider is built
+            from .anthropic import AnthropicProvider
             return AnthropicProvider(
                 api_key=config.api_key,
                 default_model=config.default_model,
@@ -79,6 +127,13 @@ class AIClientFactory:
         """Clear the provider cache"""
         self._provider_cache.clear()
     
+    async def aclose(self) -> None:
+        """Close pooled connections held by cached providers and clear the cache"""
+        providers = self._provider_cache.values()
+        self._provider_cache.clear()
+        for instance in providers:
+            await instance.aclose()
+    
     @classmethod
     def create_quick(cls, provider: str = "anthropic", **config) -> AIProvider:
         """Quick factory method for creating a provider without full configuration
@@ -90,12 +145,24 @@ class AIClientFactory:
         Returns:
             AIProvider instance
         """
-        provider_type = ProviderType(provider.lower())
+        name = provider.lower()
+        # Fall back to the enum constructor for its ValueError on unknown names
+        provider_type = _PROVIDER_BY_NAME.get(name) or ProviderType(name)
+        
+        # Reuse the shared instance (and its connection pool) when possible
+        cache_key = _config_cache_key(provider_type, config)
+        cached = cls._quick_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         if provider_type == ProviderType.ANTHROPIC:
-            return AnthropicProvider(**config)
+            from .anthropic import AnthropicProvider
+            instance = AnthropicProvider(**config)
         else:
             raise ValueError(f"Unsupported provider: {provider}")
+        
+        cls._quick_cache.put(cache_key, instance)
+        return instance
 
 
 # Convenience function for simple usage
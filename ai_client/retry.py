@@ -5,7 +5,7 @@ Retry logic for AI client operations
 import asyncio
 import time
 import random
-from typing import Callable, TypeVar, Any, Optional
+from typing import Callable, TypeVar, Any, Optional, Tuple
 from functools import wraps
 
 from .exceptions import AIRateLimitError, AIProviderError
@@ -13,6 +13,11 @@ from .exceptions import AIRateLimitError, AIProviderError
 T = TypeVar('T')
 
 
+def _backoff_delays(max_retries: int, base_delay: float, max_delay: float) -> Tuple[float, ...]:
+    """Precompute the capped exponential delay for each retry attempt"""
+    return tuple(min(base_delay * (1 << attempt), max_delay) for attempt in range(max_retries + 1))
+
+
 def exponential_backoff(
     max_retries: int = 3,
     base_delay: float = 1.0,
@@ -28,35 +33,30 @@ def exponential_backoff(
         jitter: Add random jitter to delay
     """
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        delays = _backoff_delays(max_retries, base_delay, max_delay)
+        sleep = time.sleep
+        
         @wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            last_exception = None
-            
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
-                except (AIRateLimitError, ConnectionError, TimeoutError) as e:
-                    last_exception = e
-                    
+                except (AIRateLimitError, ConnectionError, TimeoutError):
                     if attempt == max_retries:
                         raise
                     
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (2 ** attempt), max_delay)
+                    # Look up the precomputed exponential backoff delay
+                    delay = delays[attempt]
                     
                     # Add jitter to prevent thundering herd
                     if jitter:
-                        delay += random.uniform(0, delay * 0.1)
+                        delay += random.random() * delay * 0.1
                     
-                    time.sleep(delay)
+                    sleep(delay)
                 except Exception as e:
                     # Don't retry on non-recoverable errors
                     raise
             
-            # This shouldn't be reached, but just in case
-            if last_exception:
-                raise last_exception
-            
         return wrapper
     return decorator
 
@@ -69,34 +69,29 @@ def async_exponential_backoff(
 ):
     """Async version of exponential backoff decorator"""
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        delays = _backoff_delays(max_retries, base_delay, max_delay)
+        sleep = asyncio.sleep
+        
         @wraps(func)
         async def wrapper(*args, **kwargs) -> T:
-            last_exception = None
-            
             for attempt in range(max_retries + 1):
                 try:
                     return await func(*args, **kwargs)
-                except (AIRateLimitError, ConnectionError, TimeoutError) as e:
-                    last_exception = e
-                    
+                except (AIRateLimitError, ConnectionError, TimeoutError):
                     if attempt == max_retries:
                         raise
                     
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (2 ** attempt), max_delay)
+                    # Look up the precomputed exponential backoff delay
+                    delay = delays[attempt]
                     
                     # Add jitter to prevent thundering herd
                     if jitter:
-                        delay += random.uniform(0, delay * 0.1)
+                        delay += random.random() * delay * 0.1
                     
-                    await asyncio.sleep(delay)
+                    await sleep(delay)
                 except Exception as e:
                     # Don't retry on non-recoverable errors
                     raise
             
-            # This shouldn't be reached, but just in case
-            if last_exception:
-                raise last_exception
-            
         return wrapper
     return decorator
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""Per-chat dispatch - ordered within a chat, concurrent across chats."""
+
+import asyncio
+import functools
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+logger = logging.getLogger(__name__)
+
+HandlerCallback = Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[None]]
+
+
+class ChatDispatcher:
+    """Runs handler callbacks on per-chat FIFO queues.
+
+    A wrapped callback only enqueues the update and returns, so the
+    application moves on to the next update straight away. Each chat with
+    pending updates has one worker task that runs them in arrival order;
+    a slow LLM call in one chat no longer holds up any other chat.
+    """
+
+    def __init__(self):
+        self._queues: dict[int, deque] = {}
+        self._workers: dict[int, asyncio.Task] = {}
+
+    def wrap(self, callback: HandlerCallback) -> HandlerCallback:
+        """Wrap a handler callback so it runs on its chat's queue."""
+
+        @functools.wraps(callback)
+        async def dispatch(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+            chat = update.effective_chat
+            if chat is None:
+                await callback(update, context)
+                return
+            self._enqueue(chat.id, callback, update, context)
+
+        return dispatch
+
+    def _enqueue(
+        self,
+        chat_id: int,
+        callback: HandlerCallback,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+    ) -> None:
+        queue = self._queues.get(chat_id)
+        if queue is None:
+            queue = self._queues[chat_id] = deque()
+            self._workers[chat_id] = asyncio.create_task(self._work(chat_id, queue))
+        queue.append((callback, update, context))
+
+    async def _work(self, chat_id: int, queue: deque) -> None:
+        """Drain a chat's queue, then retire until its next update."""
+        try:
+            while queue:
+                callback, update, context = queue.popleft()
+                try:
+                    await callback(update, context)
+                except Exception as e:
+                    # Handlers run outside the application's own error
+                    # handling, so route failures back to it
+                    await context.application.process_error(update, e)
+        finally:
+            # No await between the empty check and here, so nothing can
+            # have been queued for this worker in the meantime
+            del self._queues[chat_id]
+            del self._workers[chat_id]
+
+    async def join(self) -> None:
+        """Wait for all queued updates to be handled."""
+        while self._workers:
+            await asyncio.gather(*self._workers.values(), return_exceptions=True)
@@ -1,5 +1,7 @@
 """Handler for /northstar command - reset goals and re-do onboarding."""
 
+import asyncio
+
 from telegram import Update
 from telegram.ext import CommandHandler, ContextTypes
 
@@ -12,6 +14,8 @@ NORTHSTAR_MESSAGE = (
     "What are the top 3 things you want to focus on now?"
 )
 
+NOT_STARTED_MESSAGE = "You haven't started yet. Use /start to begin!"
+
 
 async def northstar(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /northstar command - reset onboarding to update goals."""
@@ -25,30 +29,29 @@ async def northstar(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user = await UserRepository.get_by_telegram_id(telegram_user_id)
 
     if user is None:
-        await update.message.reply_text(
-            "You haven't started yet. Use /start to begin!"
-        )
+        await update.message.reply_text(NOT_STARTED_MESSAGE)
         return
 
-    # Reset onboarding status to STARTED
-    await UserRepository.update_onboarding_status(
-        user.id, OnboardingStatus.STARTED
+    # Reset onboarding status to STARTED and get or create the
+    # conversation; the two writes are independent
+    _, conversation = await asyncio.gather(
+        UserRepository.update_onboarding_status(
+            user.id, OnboardingStatus.STARTED
+        ),
+        ConversationRepository.get_or_create(
+            telegram_chat_id=telegram_chat_id,
+            user_id=user.id,
+        ),
     )
 
-    # Get or create conversation
-    conversation = await ConversationRepository.get_or_create(
-        telegram_chat_id=telegram_chat_id,
-        user_id=user.id,
-    )
-
-    # Send the recalibration message
-    await update.message.reply_text(NORTHSTAR_MESSAGE)
-
-    # Store the bot's message
-    await MessageRepository.create(
-        conversation_id=conversation.id,
-        role=MessageRole.ASSISTANT,
-        content=NORTHSTAR_MESSAGE,
+    # Send the recalibration message and store it concurrently
+    await asyncio.gather(
+        update.message.reply_text(NORTHSTAR_MESSAGE),
+        MessageRepository.create(
+            conversation_id=conversation.id,
+            role=MessageRole.ASSISTANT,
+            content=NORTHSTAR_MESSAGE,
+        ),
     )
 
 
@@ -1,11 +1,14 @@
 """Handler for messages during and after onboarding."""
 
+import asyncio
 import logging
+import time
 
-from telegram import Update
+from telegram import Message, Update
+from telegram.error import TelegramError
 from telegram.ext import MessageHandler, ContextTypes, filters
 
-from db import UserRepository, ConversationRepository, MessageRepository
+from db import UserRepository, MessageRepository
 from db.models import MessageRole, OnboardingStatus
 from services import OnboardingService, PonderingService
 
@@ -20,10 +23,20 @@ ONBOARDING_COMPLETE_MESSAGE = (
     "The more you share, the better I understand you and can help you move forward."
 )
 
+# Immediate acknowledgement for a pondering; it is classified afterwards
+PONDERING_ACK_MESSAGE = "✨ Noted."
+
+# Minimum seconds between progressive edits of a streamed reply, to stay
+# under Telegram's message edit rate limits
+STREAM_EDIT_INTERVAL = 0.3
+
 # Lazy-initialized services
 _onboarding_service: OnboardingService | None = None
 _pondering_service: PonderingService | None = None
 
+# Pondering classifications running after their reply was sent
+_background_tasks: set[asyncio.Task] = set()
+
 
 def get_onboarding_service() -> OnboardingService:
     """Get or create the onboarding service singleton."""
@@ -57,19 +70,17 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     telegram_user_id = update.effective_user.id
     telegram_chat_id = update.effective_chat.id
 
-    # Get user (should exist if they used /start)
-    user = await UserRepository.get_by_telegram_id(telegram_user_id)
+    # Get user (should exist if they used /start) and their conversation
+    found = await UserRepository.get_user_and_conversation(
+        telegram_user_id, telegram_chat_id
+    )
 
-    if user is None:
+    if found is None:
         # User hasn't started - prompt them
         await update.message.reply_text("Please use /start to begin!")
         return
 
-    # Get or create conversation
-    conversation = await ConversationRepository.get_or_create(
-        telegram_chat_id=telegram_chat_id,
-        user_id=user.id,
-    )
+    user, conversation = found
 
     # Route based on onboarding status
     if user.onboarding_status == OnboardingStatus.STARTED:
@@ -98,23 +109,47 @@ async def _handle_onboarding_message(
     # Check status before calling service to detect completion
     was_started = user.onboarding_status == OnboardingStatus.STARTED
 
-    # Get LLM response
-    response_text = await service.handle_message(
+    # Stream the reply: send the first text as soon as it arrives, then
+    # edit the message as more comes in
+    reply: Message | None = None
+    shown = ""
+    last_edit = 0.0
+
+    async def show_partial(text: str) -> None:
+        nonlocal reply, shown, last_edit
+        now = time.monotonic()
+        if text == shown or now - last_edit < STREAM_EDIT_INTERVAL:
+            return
+        try:
+            if reply is None:
+                reply = await update.message.reply_text(text)
+            else:
+                await reply.edit_text(text)
+        except TelegramError as e:
+            # A dropped progressive update is harmless; the final text follows
+            logger.debug(f"Skipped streaming update: {e}")
+            return
+        shown = text
+        last_edit = now
+
+    # Get LLM response and the resulting onboarding status
+    response_text, status = await service.handle_message(
         user=user,
         conversation=conversation,
         message_text=update.message.text,
+        on_partial=show_partial,
     )
 
     # Check if onboarding just completed
-    # Re-fetch user to see updated status
-    updated_user = await UserRepository.get_by_telegram_id(user.telegram_user_id)
-
-    if was_started and updated_user and updated_user.onboarding_status == OnboardingStatus.COMPLETED:
+    if was_started and status == OnboardingStatus.COMPLETED:
         # Add completion notification
         response_text += ONBOARDING_COMPLETE_MESSAGE
         logger.info(f"Onboarding completed for user {user.id}")
 
-    await update.message.reply_text(response_text)
+    if reply is None:
+        await update.message.reply_text(response_text)
+    elif response_text != shown:
+        await reply.edit_text(response_text)
 
 
 async def _handle_pondering_message(
@@ -122,44 +157,51 @@ async def _handle_pondering_message(
     user,
     conversation,
 ) -> None:
-    """Handle message after onboarding - classify and store as pondering."""
+    """Handle message after onboarding - acknowledge, then classify and
+    store as pondering in the background."""
     message_text = update.message.text
-    service = get_pondering_service()
 
-    # Store user's message in conversation
-    await MessageRepository.create(
-        conversation_id=conversation.id,
-        role=MessageRole.USER,
-        content=message_text,
-    )
+    async def store_messages() -> None:
+        # Keep the bot's message after the user's in the conversation
+        await MessageRepository.create(
+            conversation_id=conversation.id,
+            role=MessageRole.USER,
+            content=message_text,
+        )
+        await MessageRepository.create(
+            conversation_id=conversation.id,
+            role=MessageRole.ASSISTANT,
+            content=PONDERING_ACK_MESSAGE,
+        )
 
-    # Process through pondering service (classify + store)
-    pondering = await service.process_message(
-        user_id=user.id,
-        conversation_id=conversation.id,
-        message_text=message_text,
+    # Reply and store the exchange concurrently
+    await asyncio.gather(
+        update.message.reply_text(PONDERING_ACK_MESSAGE),
+        store_messages(),
     )
 
-    # Generate response based on classification
-    if pondering and pondering.is_valid:
-        category_emoji = {
-            "thought": "💭",
-            "observation": "👁️",
-            "feeling": "💫",
-        }
-        emoji = category_emoji.get(pondering.category.value, "✨")
-        response = f"{emoji} Noted."
-    else:
-        response = "Got it."
+    # Classification takes an LLM call; keep it off the reply path
+    task = asyncio.create_task(_classify_pondering(user, conversation, message_text))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
-    await update.message.reply_text(response)
 
-    # Store bot's response
-    await MessageRepository.create(
-        conversation_id=conversation.id,
-        role=MessageRole.ASSISTANT,
-        content=response,
-    )
+async def _classify_pondering(user, conversation, message_text: str) -> None:
+    """Classify and store a pondering, logging any failure."""
+    try:
+        await get_pondering_service().process_message(
+            user_id=user.id,
+            conversation_id=conversation.id,
+            message_text=message_text,
+        )
+    except Exception:
+        logger.exception(f"Failed to process pondering for user {user.id}")
+
+
+async def wait_for_background_tasks() -> None:
+    """Wait for in-flight pondering classifications to finish."""
+    while _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
 
 
 # Export the handler - handles all text messages except commands
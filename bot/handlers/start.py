@@ -1,5 +1,7 @@
 """Handler for /start command - onboarding flow."""
 
+import asyncio
+
 from telegram import Update
 from telegram.ext import CommandHandler, ContextTypes
 
@@ -25,11 +27,12 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user = await UserRepository.get_by_telegram_id(telegram_user_id)
 
     if user is None:
-        # New user - create account
+        # New user - create account with onboarding already started
         user = await UserRepository.create(
             telegram_user_id=telegram_user_id,
             name=update.effective_user.full_name,
             username=update.effective_user.username,
+            onboarding_status=OnboardingStatus.STARTED,
         )
 
     # Get or create conversation
@@ -38,20 +41,20 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         user_id=user.id,
     )
 
-    # Update onboarding status if pending
+    # Update onboarding status if an existing user is still pending
     if user.onboarding_status == OnboardingStatus.PENDING:
         await UserRepository.update_onboarding_status(
             user.id, OnboardingStatus.STARTED
         )
 
-    # Send onboarding message
-    await update.message.reply_text(ONBOARDING_MESSAGE)
-
-    # Store the bot's message
-    await MessageRepository.create(
-        conversation_id=conversation.id,
-        role=MessageRole.ASSISTANT,
-        content=ONBOARDING_MESSAGE,
+    # Send onboarding message and store it concurrently
+    await asyncio.gather(
+        update.message.reply_text(ONBOARDING_MESSAGE),
+        MessageRepository.create(
+            conversation_id=conversation.id,
+            role=MessageRole.ASSISTANT,
+            content=ONBOARDING_MESSAGE,
+        ),
     )
 
 
@@ -3,11 +3,20 @@
 import os
 import logging
 
+import uvicorn
 from dotenv import load_dotenv
 from telegram.ext import Application
 
-from db import Database
+from ai_client.anthropic import AnthropicProvider
+from db import Database, MessageRepository, PonderingRepository
+from bot.dispatch import ChatDispatcher
+from bot.webhook import create_webhook_app
 from bot.handlers import start_handler, message_handler, reset_handler, northstar_handler
+from bot.handlers.onboarding import (
+    get_onboarding_service,
+    get_pondering_service,
+    wait_for_background_tasks,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -16,19 +25,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Runs handlers on per-chat queues so one slow chat doesn't block the rest
+dispatcher = ChatDispatcher()
+
 
 async def post_init(application: Application) -> None:
     """Initialize database connection after app starts."""
     logger.info("Connecting to database...")
     await Database.connect()
+    MessageRepository.start_batching()
+    PonderingRepository.start_batching()
     logger.info("Database connected!")
 
+    # Build the services (and their LLM client) before the first update
+    get_onboarding_service()
+    get_pondering_service()
+
+
+async def post_stop(application: Application) -> None:
+    """Finish queued updates while the bot and database are still up."""
+    await dispatcher.join()
+    await wait_for_background_tasks()
+
 
 async def post_shutdown(application: Application) -> None:
     """Cleanup on shutdown."""
     logger.info("Disconnecting from database...")
+    await MessageRepository.stop_batching()
+    await PonderingRepository.stop_batching()
     await Database.disconnect()
     logger.info("Database disconnected!")
+    await AnthropicProvider.aclose_shared()
 
 
 def main() -> None:
@@ -46,30 +73,47 @@ def main() -> None:
     webhook_path = f"/webhook/{token}"  # Use token as secret path
 
     # Build application
+    # Bot API requests share one keep-alive HTTP/2 connection pool, sized so
+    # concurrent replies don't wait for a free connection
     application = (
         Application.builder()
         .token(token)
+        .updater(None)  # Updates arrive through the ASGI webhook app
+        .connection_pool_size(256)
+        .pool_timeout(30)
+        .connect_timeout(5)
+        .read_timeout(20)
+        .http_version("2")
         .post_init(post_init)
+        .post_stop(post_stop)
         .post_shutdown(post_shutdown)
         .build()
     )
 
-    # Register handlers
-    application.add_handler(start_handler)
-    application.add_handler(reset_handler)
-    application.add_handler(northstar_handler)
-    application.add_handler(message_handler)
+    # Register handlers; commands and messages of a chat share its queue so
+    # they stay in order
+    for handler in (start_handler, reset_handler, northstar_handler, message_handler):
+        handler.callback = dispatcher.wrap(handler.callback)
+        application.add_handler(handler)
 
-    # Start the bot with webhook
+    # Start the bot with webhook, served by uvicorn. One worker: the
+    # application and its per-chat queues live in a single process
     logger.info(f"Starting Alain bot with webhook on port {webhook_port}...")
     logger.info(f"Webhook URL: {webhook_url}{webhook_path}")
-    application.run_webhook(
-        listen="0.0.0.0",
-        port=webhook_port,
+    app = create_webhook_app(
+        application,
         url_path=webhook_path,
         webhook_url=f"{webhook_url}{webhook_path}",
         allowed_updates=["message"],
     )
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=webhook_port,
+        http="httptools",
+        loop="auto",  # uvloop where installed (not on Windows)
+        lifespan="on",
+    )
 
 
 if __name__ == "__main__":
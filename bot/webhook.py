@@ -0,0 +1,109 @@
+"""ASGI webhook endpoint - feeds Telegram updates into the application."""
+
+import json
+import logging
+
+from telegram import Update
+from telegram.ext import Application
+
+logger = logging.getLogger(__name__)
+
+
+async def _respond(send, status: int) -> None:
+    """Send an empty response with the given status."""
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-length", b"0")],
+    })
+    await send({"type": "http.response.body", "body": b""})
+
+
+async def _read_body(receive) -> bytes:
+    """Read the full request body."""
+    chunks = []
+    more_body = True
+    while more_body:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        more_body = message.get("more_body", False)
+    return b"".join(chunks)
+
+
+def create_webhook_app(
+    application: Application,
+    url_path: str,
+    webhook_url: str,
+    allowed_updates: list[str] | None = None,
+):
+    """Create an ASGI app serving the Telegram webhook.
+
+    Updates POSTed to url_path are decoded and put on the application's
+    update queue; the response is sent without waiting for handlers. The
+    ASGI lifespan runs the application's lifecycle (including its
+    post_init/post_stop/post_shutdown hooks) and registers the webhook,
+    since run_webhook is not used. The application should be built with
+    updater(None).
+
+    Args:
+        application: The bot application
+        url_path: Path Telegram posts updates to
+        webhook_url: Public URL registered with Telegram
+        allowed_updates: Update types to receive
+    """
+
+    async def startup() -> None:
+        await application.initialize()
+        if application.post_init:
+            await application.post_init(application)
+        await application.bot.set_webhook(url=webhook_url, allowed_updates=allowed_updates)
+        await application.start()
+
+    async def shutdown() -> None:
+        await application.stop()
+        if application.post_stop:
+            await application.post_stop(application)
+        await application.shutdown()
+        if application.post_shutdown:
+            await application.post_shutdown(application)
+
+    async def lifespan(receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                try:
+                    await startup()
+                except Exception as e:
+                    logger.exception("Bot startup failed")
+                    await send({"type": "lifespan.startup.failed", "message": str(e)})
+                    return
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def app(scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        if scope["path"] != url_path:
+            await _respond(send, 404)
+            return
+        if scope["method"] != "POST":
+            await _respond(send, 405)
+            return
+
+        try:
+            update = Update.de_json(json.loads(await _read_body(receive)), application.bot)
+        except (ValueError, TypeError, KeyError) as e:
+            logger.warning(f"Rejected malformed webhook update: {e}")
+            await _respond(send, 400)
+            return
+
+        await application.update_queue.put(update)
+        await _respond(send, 200)
+
+    return app
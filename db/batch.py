@@ -0,0 +1,107 @@
+"""Batched writes - coalesce many small inserts into one round trip."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Queued by stop() to tell the writer to flush and exit
+_STOP = object()
+
+
+class BatchWriter(Generic[T, R]):
+    """Collects items submitted by many tasks and writes them together.
+
+    A background task waits for the first item, keeps collecting for up to
+    flush_interval seconds (or until max_batch items), then hands the whole
+    batch to the flush function. Each submitter gets back its own result.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[T]], Awaitable[list[R]]],
+        max_batch: int = 100,
+        flush_interval: float = 0.02,
+    ):
+        """Create a writer.
+
+        Args:
+            flush: Writes a batch, returning one result per item in order
+            max_batch: Maximum number of items per flush
+            flush_interval: Seconds to wait for more items after the first
+        """
+        self._flush = flush
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the background writer is accepting items."""
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start the background writer on the running event loop."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush pending items and stop the background writer."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        self._queue.put_nowait(_STOP)
+        await task
+        self._queue = None
+
+    async def submit(self, item: T) -> R:
+        """Queue an item and wait for the batch containing it to be written."""
+        if self._task is None:
+            raise RuntimeError("BatchWriter is not running. Call start() first.")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+        stopping = False
+        while not stopping:
+            entry = await queue.get()
+            if entry is _STOP:
+                break
+            batch = [entry]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                try:
+                    entry = queue.get_nowait() if timeout <= 0 else await asyncio.wait_for(queue.get(), timeout)
+                except (asyncio.QueueEmpty, TimeoutError):
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+            await self._write(batch)
+
+    async def _write(self, batch: list[tuple[T, asyncio.Future]]) -> None:
+        """Flush a batch and resolve each submitter's future."""
+        try:
+            results = await self._flush([item for item, _ in batch])
+        except Exception as e:
+            logger.error(f"Batch write of {len(batch)} items failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
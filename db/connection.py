@@ -5,6 +5,34 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 import asyncpg
+import msgspec
+
+# Prepared statements cached per connection. asyncpg prepares each query
+# on first use and reuses the plan afterwards; set DB_STATEMENT_CACHE_SIZE=0
+# behind a transaction-mode pooler (pgbouncer) that can't keep them.
+STATEMENT_CACHE_SIZE = 1024
+
+# JSONB's binary wire format is a version byte followed by the JSON text
+_JSONB_VERSION = b"\x01"
+
+
+def _encode_jsonb(value) -> bytes:
+    return _JSONB_VERSION + msgspec.json.encode(value)
+
+
+def _decode_jsonb(data: bytes):
+    return msgspec.json.decode(data[1:])
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Set up a new pool connection: JSONB maps to Python objects both ways."""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_encode_jsonb,
+        decoder=_decode_jsonb,
+        schema="pg_catalog",
+        format="binary",
+    )
 
 
 class Database:
@@ -27,6 +55,12 @@ class Database:
             min_size=2,
             max_size=10,
             command_timeout=60,
+            statement_cache_size=int(
+                os.getenv("DB_STATEMENT_CACHE_SIZE", STATEMENT_CACHE_SIZE)
+            ),
+            # Keep statements for the life of the connection
+            max_cached_statement_lifetime=0,
+            init=_init_connection,
         )
 
     @classmethod
@@ -5,8 +5,10 @@ Tracks applied migrations in a schema_migrations table.
 """
 
 import asyncio
+import functools
 import os
 import sys
+from operator import itemgetter
 from pathlib import Path
 
 import asyncpg
@@ -15,8 +17,9 @@ from dotenv import load_dotenv
 MIGRATIONS_DIR = Path(__file__).parent / "migrations"
 
 
-async def get_connection() -> asyncpg.Connection:
-    """Get a database connection."""
+@functools.cache
+def get_dsn() -> str:
+    """Resolve the database DSN once per process (.env is read on first call)."""
     load_dotenv()
 
     dsn = os.getenv("DATABASE_URL")
@@ -28,8 +31,12 @@ async def get_connection() -> asyncpg.Connection:
         port = os.getenv("POSTGRES_PORT", "5431")
         db = os.getenv("POSTGRES_DB", "alain_db")
         dsn = f"postgresql://{user}:{password}@{host}:{port}/{db}"
-    
-    return await asyncpg.connect(dsn)
+    return dsn
+
+
+async def get_connection() -> asyncpg.Connection:
+    """Get a database connection."""
+    return await asyncpg.connect(get_dsn())
 
 
 async def ensure_migrations_table(conn: asyncpg.Connection) -> None:
@@ -54,25 +61,35 @@ def get_migration_files() -> list[tuple[str, Path]]:
     Expected format: V001__description.sql, V002__another.sql, etc.
     """
     migrations = []
-    for f in MIGRATIONS_DIR.glob("V*.sql"):
-        version = f.stem.split("__")[0]  # e.g., "V001"
-        migrations.append((version, f))
+    with os.scandir(MIGRATIONS_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("V") and name.endswith(".sql") and "__" in name:
+                version = name[:name.index("__")]  # e.g., "V001"
+                migrations.append((version, MIGRATIONS_DIR / name))
     
-    return sorted(migrations, key=lambda x: x[0])
+    migrations.sort(key=itemgetter(0))
+    return migrations
 
 
-async def apply_migration(conn: asyncpg.Connection, version: str, path: Path) -> None:
-    """Apply a single migration within a transaction."""
-    sql = path.read_text()
-    
+async def apply_migrations(conn: asyncpg.Connection, pending: list[tuple[str, Path]]) -> None:
+    """Apply pending migrations together within a single transaction.
+
+    The scripts run as one batch and their versions are recorded in the
+    same transaction, so either every pending migration applies or none.
+    """
+    # Newline before each separator so a trailing comment can't swallow it
+    sql = "\n;\n".join(path.read_text() for _, path in pending)
+
     async with conn.transaction():
         await conn.execute(sql)
-        await conn.execute(
+        await conn.executemany(
             "INSERT INTO schema_migrations (version) VALUES ($1)",
-            version
+            [(version,) for version, _ in pending]
         )
-    
-    print(f"  ✓ Applied: {path.name}")
+
+    for _, path in pending:
+        print(f"  ✓ Applied: {path.name}")
 
 
 async def run_migrations() -> None:
@@ -93,8 +110,7 @@ async def run_migrations() -> None:
         
         print(f"📋 Found {len(pending)} pending migration(s):")
         
-        for version, path in pending:
-            await apply_migration(conn, version, path)
+        await apply_migrations(conn, pending)
         
         print(f"✅ Successfully applied {len(pending)} migration(s).")
     
@@ -0,0 +1,29 @@
+-- Migration: Fetch a user and get-or-create their conversation in one call
+
+CREATE OR REPLACE FUNCTION fn_get_user_and_conversation(tg_user_id BIGINT, tg_chat_id BIGINT)
+RETURNS TABLE (user_row "user", conversation_row conversation) AS $$
+DECLARE
+    u "user";
+    c conversation;
+BEGIN
+    SELECT * INTO u FROM "user" WHERE telegram_user_id = tg_user_id;
+    IF NOT FOUND THEN
+        RETURN;  -- Unknown user: no row
+    END IF;
+
+    INSERT INTO conversation (telegram_chat_id, user_id)
+    VALUES (tg_chat_id, u.id)
+    ON CONFLICT (telegram_chat_id) DO NOTHING
+    RETURNING * INTO c;
+
+    IF NOT FOUND THEN
+        -- Existing conversation (or one inserted concurrently; each
+        -- statement here sees a fresh snapshot)
+        SELECT * INTO c FROM conversation WHERE telegram_chat_id = tg_chat_id;
+    END IF;
+
+    user_row := u;
+    conversation_row := c;
+    RETURN NEXT;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,7 @@
+-- Migration: Composite indexes for keyset pagination of history queries
+
+-- Ponderings by user, newest first (PonderingRepository.get_by_user_id)
+CREATE INDEX IF NOT EXISTS idx_pondering_user_received ON pondering(user_id, received_at DESC);
+
+-- Messages by conversation in send order (MessageRepository.get_conversation_messages)
+CREATE INDEX IF NOT EXISTS idx_message_conversation_sent ON message(conversation_id, sent_at);
@@ -0,0 +1,9 @@
+-- Migration: Index the category history read; drop indexes made redundant by V006
+
+-- Valid ponderings of one category, newest first (PonderingRepository.get_by_category)
+CREATE INDEX IF NOT EXISTS idx_pondering_user_category_received
+    ON pondering(user_id, category, received_at DESC) WHERE is_valid = true;
+
+-- Prefixes of the V006 composite indexes, so only cost writes
+DROP INDEX IF EXISTS idx_pondering_user_id;
+DROP INDEX IF EXISTS idx_message_conversation;
@@ -0,0 +1,10 @@
+-- Migration: Hash pondering content so repeated submissions are deduplicated
+
+-- BLAKE2b-128 of the normalized raw content; NULL for rows written before this
+ALTER TABLE pondering ADD COLUMN IF NOT EXISTS content_hash BYTEA;
+-- When the same content was last submitted again
+ALTER TABLE pondering ADD COLUMN IF NOT EXISTS last_seen_at TIMESTAMPTZ;
+
+-- Recent ponderings of a user with the same content (PonderingRepository.create)
+CREATE INDEX IF NOT EXISTS idx_pondering_user_content_hash
+    ON pondering(user_id, content_hash) WHERE content_hash IS NOT NULL;
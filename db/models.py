@@ -1,31 +1,53 @@
 """Data models for the database entities."""
 
-from dataclasses import dataclass
+from collections.abc import Mapping
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from typing import Any
 from uuid import UUID
 
+import asyncpg
+import msgspec
 
-class OnboardingStatus(str, Enum):
+# A database row: repositories pass asyncpg records straight through
+Row = asyncpg.Record | Mapping[str, Any]
+
+
+class OnboardingStatus(StrEnum):
     PENDING = "pending"
     STARTED = "started"
     COMPLETED = "completed"
 
 
-class MessageRole(str, Enum):
+class MessageRole(StrEnum):
     USER = "user"
     ASSISTANT = "assistant"
 
 
-class PonderingCategory(str, Enum):
+class PonderingCategory(StrEnum):
     THOUGHT = "thought"
     OBSERVATION = "observation"
     FEELING = "feeling"
     INVALID = "invalid"
 
+    @classmethod
+    def from_value(cls, value: str) -> "PonderingCategory":
+        """Member for a category string, INVALID if it names none."""
+        return _PONDERING_CATEGORY_BY_VALUE.get(value, cls.INVALID)
+
+
+# Value -> member tables for row decoding; a dict lookup skips the
+# Enum.__call__ machinery on every record
+_ONBOARDING_STATUS_BY_VALUE = {m.value: m for m in OnboardingStatus}
+_MESSAGE_ROLE_BY_VALUE = {m.value: m for m in MessageRole}
+_PONDERING_CATEGORY_BY_VALUE = {m.value: m for m in PonderingCategory}
 
-@dataclass
-class User:
+
+# Models are msgspec Structs: built in C with no per-instance __dict__, and
+# untracked by the GC (gc=False) since rows never form reference cycles.
+# Frozen, so cached instances can be shared safely; from_record passes
+# fields positionally, in declaration order.
+class User(msgspec.Struct, frozen=True, gc=False):
     id: UUID
     telegram_user_id: int
     name: str | None
@@ -35,20 +57,19 @@ class User:
     updated_at: datetime
 
     @classmethod
-    def from_record(cls, record: dict) -> "User":
+    def from_record(cls, record: Row) -> "User":
         return cls(
-            id=record["id"],
-            telegram_user_id=record["telegram_user_id"],
-            name=record["name"],
-            username=record["username"],
-            onboarding_status=OnboardingStatus(record["onboarding_status"]),
-            created_at=record["created_at"],
-            updated_at=record["updated_at"],
+            record["id"],
+            record["telegram_user_id"],
+            record["name"],
+            record["username"],
+            _ONBOARDING_STATUS_BY_VALUE[record["onboarding_status"]],
+            record["created_at"],
+            record["updated_at"],
         )
 
 
-@dataclass
-class Conversation:
+class Conversation(msgspec.Struct, frozen=True, gc=False):
     id: UUID
     telegram_chat_id: int
     user_id: UUID
@@ -56,18 +77,17 @@ class Conversation:
     last_message_at: datetime | None
 
     @classmethod
-    def from_record(cls, record: dict) -> "Conversation":
+    def from_record(cls, record: Row) -> "Conversation":
         return cls(
-            id=record["id"],
-            telegram_chat_id=record["telegram_chat_id"],
-            user_id=record["user_id"],
-            started_at=record["started_at"],
-            last_message_at=record["last_message_at"],
+            record["id"],
+            record["telegram_chat_id"],
+            record["user_id"],
+            record["started_at"],
+            record["last_message_at"],
         )
 
 
-@dataclass
-class Message:
+class Message(msgspec.Struct, frozen=True, gc=False):
     id: UUID
     conversation_id: UUID
     role: MessageRole
@@ -76,19 +96,29 @@ class Message:
     indexed_at: datetime | None
 
     @classmethod
-    def from_record(cls, record: dict) -> "Message":
+    def from_record(cls, record: Row) -> "Message":
         return cls(
-            id=record["id"],
-            conversation_id=record["conversation_id"],
-            role=MessageRole(record["role"]),
-            content=record["content"],
-            sent_at=record["sent_at"],
-            indexed_at=record["indexed_at"],
+            record["id"],
+            record["conversation_id"],
+            _MESSAGE_ROLE_BY_VALUE[record["role"]],
+            record["content"],
+            record["sent_at"],
+            record["indexed_at"],
         )
 
 
-@dataclass
-class UserProfile:
+class MessageContent(msgspec.Struct, frozen=True, gc=False):
+    """Just the id and text of a message, for indexing."""
+
+    id: UUID
+    content: str
+
+    @classmethod
+    def from_record(cls, record: Row) -> "MessageContent":
+        return cls(record["id"], record["content"])
+
+
+class UserProfile(msgspec.Struct, frozen=True, gc=False):
     """User profile extracted during onboarding."""
 
     id: UUID
@@ -101,21 +131,20 @@ class UserProfile:
     updated_at: datetime
 
     @classmethod
-    def from_record(cls, record: dict) -> "UserProfile":
+    def from_record(cls, record: Row) -> "UserProfile":
         return cls(
-            id=record["id"],
-            user_id=record["user_id"],
-            daily_intentions=record["daily_intentions"] or [],
-            values=record["values"] or [],
-            goals=record["goals"] or [],
-            raw_extraction=record["raw_extraction"],
-            extracted_at=record["extracted_at"],
-            updated_at=record["updated_at"],
+            record["id"],
+            record["user_id"],
+            record["daily_intentions"] or [],
+            record["values"] or [],
+            record["goals"] or [],
+            record["raw_extraction"],
+            record["extracted_at"],
+            record["updated_at"],
         )
 
 
-@dataclass
-class Pondering:
+class Pondering(msgspec.Struct, frozen=True, gc=False):
     """A thought, observation, or feeling shared by the user."""
 
     id: UUID
@@ -130,17 +159,29 @@ class Pondering:
     processed_at: datetime
 
     @classmethod
-    def from_record(cls, record: dict) -> "Pondering":
+    def from_record(cls, record: Row) -> "Pondering":
         return cls(
-            id=record["id"],
-            user_id=record["user_id"],
-            conversation_id=record["conversation_id"],
-            raw_content=record["raw_content"],
-            cleaned_content=record["cleaned_content"],
-            interpretation=record["interpretation"],
-            category=PonderingCategory(record["category"]),
-            is_valid=record["is_valid"],
-            received_at=record["received_at"],
-            processed_at=record["processed_at"],
+            record["id"],
+            record["user_id"],
+            record["conversation_id"],
+            record["raw_content"],
+            record["cleaned_content"],
+            record["interpretation"],
+            PonderingCategory.from_value(record["category"]),
+            record["is_valid"],
+            record["received_at"],
+            record["processed_at"],
         )
 
+
+class PonderingInput(msgspec.Struct, frozen=True, gc=False):
+    """A classified pondering waiting to be stored."""
+
+    user_id: UUID
+    conversation_id: UUID
+    raw_content: str
+    cleaned_content: str | None
+    interpretation: str | None
+    category: PonderingCategory
+    is_valid: bool = True
+    content_hash: bytes | None = None
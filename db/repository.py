@@ -1,33 +1,140 @@
-"""Repository layer with prepared SQL statements."""
+"""Repository layer with prepared SQL statements.
 
-from uuid import UUID
+Queries are plain strings passed to fetch/fetchrow/execute: asyncpg
+prepares each one as a named statement on first use per connection and
+reuses it from the connection's statement cache (sized in
+db.connection), so there is no parse/plan per call to hand-optimize.
+"""
 
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+from .batch import BatchWriter
 from .connection import Database
-import json
 from .models import (
     User,
     Conversation,
     Message,
+    MessageContent,
     UserProfile,
     Pondering,
+    PonderingInput,
     OnboardingStatus,
     MessageRole,
     PonderingCategory,
 )
 
+# Seconds a user looked up by Telegram ID is served from memory
+USER_CACHE_TTL = 60.0
+# Users kept in memory at most; the least recently used are dropped first
+USER_CACHE_SIZE = 10_000
+
+# A pondering with the same content hash as one the user submitted this
+# recently is a resubmission (retry, double send) and isn't stored again
+PONDERING_DUPLICATE_WINDOW = timedelta(minutes=10)
+
+
+class _UserLRU:
+    """Bounded LRU map of users by Telegram ID, with a TTL per entry."""
+
+    def __init__(self, maxsize: int = USER_CACHE_SIZE, ttl: float = USER_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # telegram_user_id -> (user, expiry on the monotonic clock)
+        self._data: OrderedDict[int, tuple[User, float]] = OrderedDict()
+        # user id -> telegram_user_id, to drop entries by primary key
+        self._telegram_ids: dict[UUID, int] = {}
+
+    def get(self, telegram_user_id: int) -> User | None:
+        cached = self._data.get(telegram_user_id)
+        if cached is None:
+            return None
+        if cached[1] <= time.monotonic():
+            self.discard(telegram_user_id)
+            return None
+        self._data.move_to_end(telegram_user_id)
+        return cached[0]
+
+    def put(self, user: User) -> None:
+        # The Telegram ID may have belonged to a since-deleted user
+        self.discard(user.telegram_user_id)
+        self._data[user.telegram_user_id] = (user, time.monotonic() + self.ttl)
+        self._telegram_ids[user.id] = user.telegram_user_id
+        while len(self._data) > self.maxsize:
+            _, (evicted, _) = self._data.popitem(last=False)
+            self._telegram_ids.pop(evicted.id, None)
+
+    def discard(self, telegram_user_id: int) -> None:
+        cached = self._data.pop(telegram_user_id, None)
+        if cached is not None:
+            self._telegram_ids.pop(cached[0].id, None)
+
+    def discard_id(self, user_id: UUID) -> None:
+        telegram_user_id = self._telegram_ids.get(user_id)
+        if telegram_user_id is not None:
+            self.discard(telegram_user_id)
+
 
 class UserRepository:
     """User CRUD operations with prepared statements."""
 
+    # Kept in step with every write below
+    _cache = _UserLRU()
+
+    @classmethod
+    def _remember(cls, user: User) -> User:
+        """Cache a user row read or returned by a write."""
+        cls._cache.put(user)
+        return user
+
+    @classmethod
+    def _forget(cls, user_id: UUID) -> None:
+        """Drop a cached user by primary key."""
+        cls._cache.discard_id(user_id)
+
     @classmethod
     async def get_by_telegram_id(cls, telegram_user_id: int) -> User | None:
-        """Get user by Telegram user ID."""
+        """Get user by Telegram user ID.
+
+        Served from an in-process cache for USER_CACHE_TTL seconds after
+        the row was last read or written.
+        """
+        cached = cls._cache.get(telegram_user_id)
+        if cached is not None:
+            return cached
+
         async with Database.acquire() as conn:
             row = await conn.fetchrow(
                 'SELECT * FROM "user" WHERE telegram_user_id = $1',
                 telegram_user_id
             )
-            return User.from_record(row) if row else None
+        if row is None:
+            cls._cache.discard(telegram_user_id)
+            return None
+        return cls._remember(User.from_record(row))
+
+    @classmethod
+    async def get_user_and_conversation(
+        cls, telegram_user_id: int, telegram_chat_id: int
+    ) -> tuple[User, Conversation] | None:
+        """Get a user and get or create their conversation in one round trip.
+
+        Returns:
+            Tuple of (user, conversation), or None if the user doesn't exist
+        """
+        async with Database.acquire() as conn:
+            row = await conn.fetchrow(
+                "SELECT * FROM fn_get_user_and_conversation($1, $2)",
+                telegram_user_id,
+                telegram_chat_id,
+            )
+        if row is None:
+            cls._cache.discard(telegram_user_id)
+            return None
+        user = cls._remember(User.from_record(row["user_row"]))
+        return user, Conversation.from_record(row["conversation_row"])
 
     @classmethod
     async def create(
@@ -35,20 +142,22 @@ class UserRepository:
         telegram_user_id: int,
         name: str | None = None,
         username: str | None = None,
+        onboarding_status: OnboardingStatus = OnboardingStatus.PENDING,
     ) -> User:
-        """Create a new user."""
+        """Create a new user, optionally already at a later onboarding status."""
         async with Database.acquire() as conn:
             row = await conn.fetchrow(
                 """
-                INSERT INTO "user" (telegram_user_id, name, username)
-                VALUES ($1, $2, $3)
+                INSERT INTO "user" (telegram_user_id, name, username, onboarding_status)
+                VALUES ($1, $2, $3, $4)
                 RETURNING *
                 """,
                 telegram_user_id,
                 name,
                 username,
+                onboarding_status.value,
             )
-            return User.from_record(row)
+            return cls._remember(User.from_record(row))
 
     @classmethod
     async def update_onboarding_status(
@@ -65,45 +174,24 @@ class UserRepository:
                 user_id,
                 status.value,
             )
-            return User.from_record(row) if row else None
+        if row is None:
+            cls._forget(user_id)
+            return None
+        return cls._remember(User.from_record(row))
 
     @classmethod
     async def delete_all_data(cls, user_id: UUID) -> None:
         """Delete all data for a user (messages, ponderings, conversations, profile, user).
         
-        Uses a transaction to ensure atomicity.
+        Every table references the user (directly or via conversation) with
+        ON DELETE CASCADE, so one statement removes it all atomically.
         """
-        async with Database.transaction() as conn:
-            # Delete messages (via conversations)
-            await conn.execute(
-                """
-                DELETE FROM message
-                WHERE conversation_id IN (
-                    SELECT id FROM conversation WHERE user_id = $1
-                )
-                """,
-                user_id,
-            )
-            # Delete ponderings
-            await conn.execute(
-                'DELETE FROM pondering WHERE user_id = $1',
-                user_id,
-            )
-            # Delete conversations
-            await conn.execute(
-                'DELETE FROM conversation WHERE user_id = $1',
-                user_id,
-            )
-            # Delete user profile
-            await conn.execute(
-                'DELETE FROM user_profile WHERE user_id = $1',
-                user_id,
-            )
-            # Delete user
+        async with Database.acquire() as conn:
             await conn.execute(
                 'DELETE FROM "user" WHERE id = $1',
                 user_id,
             )
+        cls._forget(user_id)
 
 
 class ConversationRepository:
@@ -136,11 +224,33 @@ class ConversationRepository:
 
     @classmethod
     async def get_or_create(cls, telegram_chat_id: int, user_id: UUID) -> Conversation:
-        """Get existing conversation or create new one."""
-        existing = await cls.get_by_telegram_chat_id(telegram_chat_id)
-        if existing:
-            return existing
-        return await cls.create(telegram_chat_id, user_id)
+        """Get existing conversation or create new one.
+
+        One statement: inserts unless the chat already has a conversation,
+        in which case the existing row is returned untouched (no write).
+        """
+        async with Database.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                WITH ins AS (
+                    INSERT INTO conversation (telegram_chat_id, user_id)
+                    VALUES ($1, $2)
+                    ON CONFLICT (telegram_chat_id) DO NOTHING
+                    RETURNING *
+                )
+                SELECT * FROM ins
+                UNION ALL
+                SELECT * FROM conversation WHERE telegram_chat_id = $1
+                LIMIT 1
+                """,
+                telegram_chat_id,
+                user_id,
+            )
+        if row is None:
+            # Lost a race with a concurrent insert not yet visible to our
+            # snapshot; it has committed by now
+            return await cls.get_by_telegram_chat_id(telegram_chat_id)
+        return Conversation.from_record(row)
 
     @classmethod
     async def update_last_message_at(cls, conversation_id: UUID) -> None:
@@ -158,6 +268,28 @@ class ConversationRepository:
 class MessageRepository:
     """Message CRUD operations."""
 
+    # Coalesce concurrent creates into multi-row inserts, and indexing
+    # cycles into one UPDATE, while running
+    _writer: BatchWriter[tuple[UUID, MessageRole, str], Message] | None = None
+    _index_writer: BatchWriter[list[UUID], None] | None = None
+
+    @classmethod
+    def start_batching(cls, max_batch: int = 25, flush_interval: float = 0.005) -> None:
+        """Start batching message writes (call once the pool is connected)."""
+        if cls._writer is None:
+            cls._writer = BatchWriter(cls._create_many, max_batch, flush_interval)
+            # Indexing isn't latency-sensitive: wait longer, merge more
+            cls._index_writer = BatchWriter(cls._mark_many_as_indexed, 100, 0.1)
+        cls._writer.start()
+        cls._index_writer.start()
+
+    @classmethod
+    async def stop_batching(cls) -> None:
+        """Flush pending message writes and go back to direct writes."""
+        if cls._writer is not None:
+            await cls._writer.stop()
+            await cls._index_writer.stop()
+
     @classmethod
     async def create(
         cls,
@@ -165,69 +297,172 @@ class MessageRepository:
         role: MessageRole,
         content: str,
     ) -> Message:
-        """Create a new message."""
+        """Create a new message.
+
+        While batching is running the insert is queued and written together
+        with other pending messages.
+        """
+        if cls._writer is not None and cls._writer.running:
+            return await cls._writer.submit((conversation_id, role, content))
+
         async with Database.acquire() as conn:
+            # Insert and bump the conversation's last_message_at in one
+            # statement (one round trip, one commit)
             row = await conn.fetchrow(
                 """
-                INSERT INTO message (conversation_id, role, content)
-                VALUES ($1, $2, $3)
-                RETURNING *
+                WITH m AS (
+                    INSERT INTO message (conversation_id, role, content)
+                    VALUES ($1, $2, $3)
+                    RETURNING *
+                ), c AS (
+                    UPDATE conversation SET last_message_at = NOW()
+                    WHERE id = $1
+                )
+                SELECT * FROM m
                 """,
                 conversation_id,
                 role.value,
                 content,
             )
-            # Update conversation's last_message_at
-            await ConversationRepository.update_last_message_at(conversation_id)
             return Message.from_record(row)
 
+    @classmethod
+    async def _create_many(
+        cls,
+        items: list[tuple[UUID, MessageRole, str]],
+    ) -> list[Message]:
+        """Insert several messages and touch their conversations in one
+        statement, in order.
+
+        Ids are generated here so rows can be matched back to items.
+        clock_timestamp() keeps sent_at increasing within the batch.
+        """
+        ids = [uuid4() for _ in items]
+        conversation_ids = [conversation_id for conversation_id, _, _ in items]
+        async with Database.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                WITH m AS (
+                    INSERT INTO message (id, conversation_id, role, content, sent_at)
+                    SELECT id, conversation_id, role::message_role, content, clock_timestamp()
+                    FROM unnest($1::uuid[], $2::uuid[], $3::text[], $4::text[])
+                        WITH ORDINALITY AS v(id, conversation_id, role, content, ord)
+                    ORDER BY ord
+                    RETURNING *
+                ), c AS (
+                    UPDATE conversation SET last_message_at = NOW()
+                    WHERE id = ANY($2::uuid[])
+                )
+                SELECT * FROM m
+                """,
+                ids,
+                conversation_ids,
+                [role.value for _, role, _ in items],
+                [content for _, _, content in items],
+            )
+        by_id = {row["id"]: Message.from_record(row) for row in rows}
+        return [by_id[id_] for id_ in ids]
+
     @classmethod
     async def get_conversation_messages(
         cls,
         conversation_id: UUID,
         limit: int = 50,
+        after: datetime | None = None,
     ) -> list[Message]:
-        """Get messages for a conversation, ordered by sent_at."""
+        """Get messages for a conversation, ordered by sent_at.
+
+        Pass the sent_at of the last message of a page as `after` to get
+        the next page (keyset pagination, no OFFSET scan).
+        """
         async with Database.acquire() as conn:
             rows = await conn.fetch(
                 """
-                SELECT * FROM message
+                SELECT id, conversation_id, role, content, sent_at, indexed_at FROM message
                 WHERE conversation_id = $1
+                    AND ($2::timestamptz IS NULL OR sent_at > $2)
                 ORDER BY sent_at ASC
-                LIMIT $2
+                LIMIT $3
                 """,
                 conversation_id,
+                after,
                 limit,
             )
             return [Message.from_record(row) for row in rows]
 
     @classmethod
-    async def get_unindexed_messages(cls, limit: int = 100) -> list[Message]:
-        """Get messages that haven't been indexed for RAG."""
+    async def get_recent_messages(
+        cls,
+        conversation_id: UUID,
+        limit: int = 20,
+    ) -> list[Message]:
+        """Get the newest messages of a conversation, ordered by sent_at.
+
+        Reads the index backwards from the newest message, so the cost
+        depends on limit, not on the length of the conversation.
+        """
         async with Database.acquire() as conn:
             rows = await conn.fetch(
                 """
-                SELECT * FROM message
+                SELECT id, conversation_id, role, content, sent_at, indexed_at FROM message
+                WHERE conversation_id = $1
+                ORDER BY sent_at DESC
+                LIMIT $2
+                """,
+                conversation_id,
+                limit,
+            )
+            return [Message.from_record(row) for row in reversed(rows)]
+
+    @classmethod
+    async def get_unindexed_messages(cls, limit: int = 100) -> list[MessageContent]:
+        """Get the id and content of messages that haven't been indexed for RAG."""
+        async with Database.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id, content FROM message
                 WHERE indexed_at IS NULL
                 ORDER BY sent_at ASC
                 LIMIT $1
                 """,
                 limit,
             )
-            return [Message.from_record(row) for row in rows]
+            return [MessageContent.from_record(row) for row in rows]
 
     @classmethod
     async def mark_as_indexed(cls, message_ids: list[UUID]) -> None:
-        """Mark messages as indexed."""
+        """Mark messages as indexed.
+
+        While batching is running, ids from concurrent or back-to-back
+        calls are merged into a single UPDATE.
+        """
+        if cls._index_writer is not None and cls._index_writer.running:
+            await cls._index_writer.submit(message_ids)
+            return
+
         async with Database.acquire() as conn:
             await conn.execute(
                 """
                 UPDATE message SET indexed_at = NOW()
-                WHERE id = ANY($1)
+                WHERE id = ANY($1::uuid[])
                 """,
                 message_ids,
             )
 
+    @classmethod
+    async def _mark_many_as_indexed(cls, batches: list[list[UUID]]) -> list[None]:
+        """Mark the ids of several mark_as_indexed calls in one UPDATE."""
+        message_ids = list({message_id for batch in batches for message_id in batch})
+        async with Database.acquire() as conn:
+            await conn.execute(
+                """
+                UPDATE message SET indexed_at = NOW()
+                WHERE id = ANY($1::uuid[])
+                """,
+                message_ids,
+            )
+        return [None] * len(batches)
+
 
 class UserProfileRepository:
     """User profile CRUD operations."""
@@ -260,10 +495,10 @@ class UserProfileRepository:
                 RETURNING *
                 """,
                 user_id,
-                json.dumps(daily_intentions),
-                json.dumps(values),
-                json.dumps(goals),
-                json.dumps(raw_extraction) if raw_extraction else None,
+                daily_intentions,
+                values,
+                goals,
+                raw_extraction or None,
             )
             return UserProfile.from_record(row)
 
@@ -286,10 +521,10 @@ class UserProfileRepository:
                 RETURNING *
                 """,
                 user_id,
-                json.dumps(daily_intentions),
-                json.dumps(values),
-                json.dumps(goals),
-                json.dumps(raw_extraction) if raw_extraction else None,
+                daily_intentions,
+                values,
+                goals,
+                raw_extraction or None,
             )
             return UserProfile.from_record(row) if row else None
 
@@ -317,10 +552,10 @@ class UserProfileRepository:
                 RETURNING *
                 """,
                 user_id,
-                json.dumps(daily_intentions),
-                json.dumps(values),
-                json.dumps(goals),
-                json.dumps(raw_extraction) if raw_extraction else None,
+                daily_intentions,
+                values,
+                goals,
+                raw_extraction or None,
             )
             return UserProfile.from_record(row)
 
@@ -328,6 +563,22 @@ class UserProfileRepository:
 class PonderingRepository:
     """Pondering CRUD operations for storing user thoughts/observations."""
 
+    # Coalesces concurrent creates into one multi-row insert while running
+    _writer: BatchWriter[PonderingInput, Pondering] | None = None
+
+    @classmethod
+    def start_batching(cls, max_batch: int = 25, flush_interval: float = 0.005) -> None:
+        """Start batching pondering writes (call once the pool is connected)."""
+        if cls._writer is None:
+            cls._writer = BatchWriter(cls.bulk_create, max_batch, flush_interval)
+        cls._writer.start()
+
+    @classmethod
+    async def stop_batching(cls) -> None:
+        """Flush pending pondering writes and go back to direct writes."""
+        if cls._writer is not None:
+            await cls._writer.stop()
+
     @classmethod
     async def create(
         cls,
@@ -338,14 +589,48 @@ class PonderingRepository:
         interpretation: str | None,
         category: PonderingCategory,
         is_valid: bool = True,
+        content_hash: bytes | None = None,
     ) -> Pondering:
-        """Create a new pondering entry."""
+        """Create a new pondering entry.
+
+        With a content_hash, a pondering the user submitted within
+        PONDERING_DUPLICATE_WINDOW with the same hash is returned instead
+        (its last_seen_at bumped) and no row is inserted.
+
+        While batching is running the insert is queued and written together
+        with other pending ponderings.
+        """
+        if cls._writer is not None and cls._writer.running:
+            return await cls._writer.submit(PonderingInput(
+                user_id=user_id,
+                conversation_id=conversation_id,
+                raw_content=raw_content,
+                cleaned_content=cleaned_content,
+                interpretation=interpretation,
+                category=category,
+                is_valid=is_valid,
+                content_hash=content_hash,
+            ))
+
         async with Database.acquire() as conn:
             row = await conn.fetchrow(
                 """
-                INSERT INTO pondering (user_id, conversation_id, raw_content, cleaned_content, interpretation, category, is_valid)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-                RETURNING *
+                WITH seen AS (
+                    UPDATE pondering SET last_seen_at = NOW()
+                    WHERE $8::bytea IS NOT NULL
+                        AND user_id = $1 AND content_hash = $8
+                        AND received_at > NOW() - $9::interval
+                    RETURNING *
+                ), inserted AS (
+                    INSERT INTO pondering (user_id, conversation_id, raw_content, cleaned_content, interpretation, category, is_valid, content_hash)
+                    SELECT $1::uuid, $2::uuid, $3::text, $4::text, $5::text, $6::pondering_category, $7::bool, $8::bytea
+                    WHERE NOT EXISTS (SELECT 1 FROM seen)
+                    RETURNING *
+                )
+                SELECT * FROM seen
+                UNION ALL
+                SELECT * FROM inserted
+                LIMIT 1
                 """,
                 user_id,
                 conversation_id,
@@ -354,40 +639,106 @@ class PonderingRepository:
                 interpretation,
                 category.value,
                 is_valid,
+                content_hash,
+                PONDERING_DUPLICATE_WINDOW,
             )
             return Pondering.from_record(row)
 
+    @classmethod
+    async def bulk_create(cls, items: list[PonderingInput]) -> list[Pondering]:
+        """Insert several ponderings in one statement, in order.
+
+        Items whose content_hash matches a recent pondering of the same
+        user get that pondering back, as in create. So do repeats within
+        the batch (a double send flushed together): only the first of them
+        is written. Ids are generated here so rows can be matched back to
+        items.
+        """
+        if not items:
+            return []
+
+        # Position in unique of the item each input resolves to
+        first: dict[tuple[UUID, bytes], int] = {}
+        unique: list[PonderingInput] = []
+        slots: list[int] = []
+        for item in items:
+            if item.content_hash is not None:
+                key = (item.user_id, item.content_hash)
+                if key in first:
+                    slots.append(first[key])
+                    continue
+                first[key] = len(unique)
+            slots.append(len(unique))
+            unique.append(item)
+
+        ids = [uuid4() for _ in unique]
+        async with Database.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                WITH v AS (
+                    SELECT * FROM unnest($1::uuid[], $2::uuid[], $3::uuid[], $4::text[], $5::text[], $6::text[], $7::text[], $8::bool[], $9::bytea[])
+                        AS v(id, user_id, conversation_id, raw_content, cleaned_content, interpretation, category, is_valid, content_hash)
+                ), seen AS (
+                    UPDATE pondering p SET last_seen_at = NOW()
+                    FROM v
+                    WHERE p.user_id = v.user_id AND p.content_hash = v.content_hash
+                        AND p.received_at > NOW() - $10::interval
+                    RETURNING v.id AS item_id, p.*
+                ), inserted AS (
+                    INSERT INTO pondering (id, user_id, conversation_id, raw_content, cleaned_content, interpretation, category, is_valid, content_hash)
+                    SELECT id, user_id, conversation_id, raw_content, cleaned_content, interpretation, category::pondering_category, is_valid, content_hash
+                    FROM v
+                    WHERE id NOT IN (SELECT item_id FROM seen)
+                    RETURNING id AS item_id, *
+                )
+                SELECT * FROM seen
+                UNION ALL
+                SELECT * FROM inserted
+                """,
+                ids,
+                [item.user_id for item in unique],
+                [item.conversation_id for item in unique],
+                [item.raw_content for item in unique],
+                [item.cleaned_content for item in unique],
+                [item.interpretation for item in unique],
+                [item.category.value for item in unique],
+                [item.is_valid for item in unique],
+                [item.content_hash for item in unique],
+                PONDERING_DUPLICATE_WINDOW,
+            )
+        by_id = {row["item_id"]: Pondering.from_record(row) for row in rows}
+        results = [by_id[id_] for id_ in ids]
+        return [results[slot] for slot in slots]
+
     @classmethod
     async def get_by_user_id(
         cls,
         user_id: UUID,
         valid_only: bool = True,
         limit: int = 100,
+        before: datetime | None = None,
     ) -> list[Pondering]:
-        """Get ponderings for a user, ordered by received_at."""
+        """Get ponderings for a user, newest first.
+
+        Pass the received_at of the last pondering of a page as `before`
+        to get the next page (keyset pagination, no OFFSET scan).
+        """
         async with Database.acquire() as conn:
-            if valid_only:
-                rows = await conn.fetch(
-                    """
-                    SELECT * FROM pondering
-                    WHERE user_id = $1 AND is_valid = true
-                    ORDER BY received_at DESC
-                    LIMIT $2
-                    """,
-                    user_id,
-                    limit,
-                )
-            else:
-                rows = await conn.fetch(
-                    """
-                    SELECT * FROM pondering
-                    WHERE user_id = $1
-                    ORDER BY received_at DESC
-                    LIMIT $2
-                    """,
-                    user_id,
-                    limit,
-                )
+            rows = await conn.fetch(
+                """
+                SELECT id, user_id, conversation_id, raw_content, cleaned_content, interpretation,
+                    category, is_valid, received_at, processed_at
+                FROM pondering
+                WHERE user_id = $1 AND ($2::bool IS FALSE OR is_valid = true)
+                    AND ($3::timestamptz IS NULL OR received_at < $3)
+                ORDER BY received_at DESC
+                LIMIT $4
+                """,
+                user_id,
+                valid_only,
+                before,
+                limit,
+            )
             return [Pondering.from_record(row) for row in rows]
 
     @classmethod
@@ -401,7 +752,9 @@ class PonderingRepository:
         async with Database.acquire() as conn:
             rows = await conn.fetch(
                 """
-                SELECT * FROM pondering
+                SELECT id, user_id, conversation_id, raw_content, cleaned_content, interpretation,
+                    category, is_valid, received_at, processed_at
+                FROM pondering
                 WHERE user_id = $1 AND category = $2 AND is_valid = true
                 ORDER BY received_at DESC
                 LIMIT $3
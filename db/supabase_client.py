@@ -1,9 +1,31 @@
 """Supabase client management for database and edge functions."""
 
+import functools
 import os
+from typing import TYPE_CHECKING
 
-from supabase import create_client, Client
-from supabase.lib.client_options import ClientOptions
+if TYPE_CHECKING:
+    from supabase import Client
+
+
+def _create_client(url: str, key: str, auto_refresh_token: bool) -> "Client":
+    """Create a Supabase client, importing the SDK on first use.
+
+    All data access goes through asyncpg (see db.repository); the Supabase
+    SDK is only needed for auth/edge-function use, so it is an optional
+    dependency (the `supabase` extra) and importing db doesn't load it.
+    """
+    from supabase import create_client
+    from supabase.lib.client_options import ClientOptions
+
+    return create_client(
+        url,
+        key,
+        options=ClientOptions(
+            auto_refresh_token=auto_refresh_token,
+            persist_session=False,
+        )
+    )
 
 
 class SupabaseClient:
@@ -15,9 +37,6 @@ class SupabaseClient:
         SUPABASE_SERVICE_KEY: (Optional) Service role key for admin operations
     """
     
-    _client: Client | None = None
-    _admin_client: Client | None = None
-    
     @classmethod
     def _get_url(cls) -> str:
         """Get Supabase URL from environment."""
@@ -40,60 +59,51 @@ class SupabaseClient:
         return os.getenv("SUPABASE_SERVICE_KEY")
     
     @classmethod
-    def get_client(cls) -> Client:
+    def get_client(cls) -> "Client":
         """Get or create the Supabase client using anon key.
         
         Use this for regular operations that should respect RLS policies.
         """
-        if cls._client is None:
-            cls._client = create_client(
-                cls._get_url(),
-                cls._get_anon_key(),
-                options=ClientOptions(
-                    auto_refresh_token=True,
-                    persist_session=False,
-                )
-            )
-        return cls._client
+        return get_supabase()
     
     @classmethod
-    def get_admin_client(cls) -> Client:
+    def get_admin_client(cls) -> "Client":
         """Get or create the Supabase client using service role key.
         
         Use this for admin operations that bypass RLS policies.
         Requires SUPABASE_SERVICE_KEY to be set.
         """
-        if cls._admin_client is None:
-            service_key = cls._get_service_key()
-            if not service_key:
-                raise ValueError(
-                    "SUPABASE_SERVICE_KEY environment variable not set. "
-                    "Required for admin operations."
-                )
-            cls._admin_client = create_client(
-                cls._get_url(),
-                service_key,
-                options=ClientOptions(
-                    auto_refresh_token=False,
-                    persist_session=False,
-                )
-            )
-        return cls._admin_client
+        return get_supabase_admin()
     
     @classmethod
     def reset(cls) -> None:
         """Reset clients (useful for testing or reconnection)."""
-        cls._client = None
-        cls._admin_client = None
+        get_supabase.cache_clear()
+        get_supabase_admin.cache_clear()
 
 
-# Convenience functions for quick access
-def get_supabase() -> Client:
+# Convenience functions for quick access; each client is created once
+@functools.cache
+def get_supabase() -> "Client":
     """Get the default Supabase client."""
-    return SupabaseClient.get_client()
+    return _create_client(
+        SupabaseClient._get_url(),
+        SupabaseClient._get_anon_key(),
+        auto_refresh_token=True,
+    )
 
 
-def get_supabase_admin() -> Client:
+@functools.cache
+def get_supabase_admin() -> "Client":
     """Get the admin Supabase client (bypasses RLS)."""
-    return SupabaseClient.get_admin_client()
-
+    service_key = SupabaseClient._get_service_key()
+    if not service_key:
+        raise ValueError(
+            "SUPABASE_SERVICE_KEY environment variable not set. "
+            "Required for admin operations."
+        )
+    return _create_client(
+        SupabaseClient._get_url(),
+        service_key,
+        auto_refresh_token=False,
+    )
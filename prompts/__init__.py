@@ -2,7 +2,7 @@
 
 from .base import BasePrompt, PromptMessage
 from .onboarding import OnboardingPrompt, OnboardingResult
-from .pondering import PonderingResult, create_pondering_messages
+from .pondering import PonderingResult, create_pondering_batch_messages, create_pondering_messages
 
 __all__ = [
     "BasePrompt",
@@ -11,5 +11,6 @@ __all__ = [
     "OnboardingResult",
     "PonderingResult",
     "create_pondering_messages",
+    "create_pondering_batch_messages",
 ]
 
@@ -1,17 +1,20 @@
 """Base prompt abstractions."""
 
+import functools
 import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptMessage:
     """A message in a prompt conversation."""
 
     role: str  # "system", "user", "assistant"
     content: str
+    cache: bool = False  # Prompt-cache breakpoint after this message
 
 
 class BasePrompt(ABC):
@@ -29,6 +32,44 @@ class BasePrompt(ABC):
         ...
 
 
+@functools.lru_cache(maxsize=32)
+def _open_tags_pattern(tags: tuple[str, ...]) -> re.Pattern[str]:
+    """Compiled pattern matching an opening tag from a fixed set."""
+    return re.compile("<(" + "|".join(map(re.escape, tags)) + ")>")
+
+
+def iter_tags(text: str, tags: tuple[str, ...]) -> Iterator[tuple[str, str]]:
+    """Iterate over the tags from a fixed set, in order of appearance.
+
+    One left-to-right pass: opening tags are found with a single
+    alternation pattern and each closing tag with str.find, so there is
+    no backtracking however malformed the text is. Tags nested inside a
+    matched tag are not reported; unclosed tags are skipped.
+
+    Args:
+        text: The text to search
+        tags: The tag names (without angle brackets)
+
+    Yields:
+        (tag, content) pairs, content unstripped
+    """
+    open_pattern = _open_tags_pattern(tags)
+    unclosed: set[str] = set()
+    pos = 0
+    while match := open_pattern.search(text, pos):
+        tag = match.group(1)
+        pos = match.end()
+        if tag in unclosed:
+            continue
+        end = text.find(f"</{tag}>", pos)
+        if end < 0:
+            # No closing tag further on, for this or any later opening
+            unclosed.add(tag)
+            continue
+        yield tag, text[pos:end]
+        pos = end + len(tag) + 3
+
+
 def extract_tag(text: str, tag: str) -> str | None:
     """Extract content from an XML tag.
 
@@ -39,9 +80,82 @@ def extract_tag(text: str, tag: str) -> str | None:
     Returns:
         The content inside the tag, or None if not found
     """
-    pattern = rf"<{tag}>(.*?)</{tag}>"
-    match = re.search(pattern, text, re.DOTALL)
-    return match.group(1).strip() if match else None
+    # Two str.find scans: same result as a lazy <tag>(.*?)</tag> search,
+    # without the regex engine or any backtracking
+    open_tag = f"<{tag}>"
+    start = text.find(open_tag)
+    if start < 0:
+        return None
+    start += len(open_tag)
+    end = text.find(f"</{tag}>", start)
+    return text[start:end].strip() if end >= 0 else None
+
+
+def extract_tags(text: str, tags: frozenset[str]) -> dict[str, str]:
+    """Extract the content of several tags in one left-to-right scan.
+
+    Walks the text from "<" to "<" with str.find, looking each tag name
+    up in the set, and stops once every tag has been found. Tags need not
+    be at the top level: names not in the set (such as a wrapping tag)
+    are stepped into rather than over.
+
+    Args:
+        text: The text to search
+        tags: The tag names (without angle brackets)
+
+    Returns:
+        Stripped content of the first occurrence of each tag found
+    """
+    found: dict[str, str] = {}
+    unclosed: set[str] = set()
+    longest = max(map(len, tags), default=0)
+    pos = 0
+    while len(found) < len(tags):
+        start = text.find("<", pos)
+        if start < 0:
+            break
+        pos = start + 1
+        # Only look as far as the longest name for the end of the tag
+        end = text.find(">", pos, pos + longest + 1)
+        if end < 0:
+            continue
+        tag = text[pos:end]
+        if tag not in tags or tag in found or tag in unclosed:
+            continue
+        close = text.find(f"</{tag}>", end + 1)
+        if close < 0:
+            unclosed.add(tag)
+            continue
+        found[tag] = text[end + 1:close].strip()
+        pos = close + len(tag) + 3
+    return found
+
+
+def extract_partial_tag(text: str, tag: str) -> str | None:
+    """Extract content from an XML tag that may not be closed yet.
+
+    Used on streamed output: returns what has arrived inside the tag so
+    far, without a trailing tag that has only partly arrived.
+
+    Args:
+        text: The text received so far
+        tag: The tag name (without angle brackets)
+
+    Returns:
+        The content inside the tag, or None if the tag hasn't opened
+    """
+    open_tag = f"<{tag}>"
+    start = text.find(open_tag)
+    if start < 0:
+        return None
+    start += len(open_tag)
+    end = text.find(f"</{tag}>", start)
+    if end < 0:
+        # Hold back a possible closing tag still in flight, e.g. "</resp"
+        end = text.rfind("<", start)
+        if end < 0:
+            end = len(text)
+    return text[start:end].strip()
 
 
 def extract_list(text: str, parent_tag: str, item_tag: str) -> list[str]:
@@ -58,6 +172,5 @@ def extract_list(text: str, parent_tag: str, item_tag: str) -> list[str]:
     parent_content = extract_tag(text, parent_tag)
     if not parent_content:
         return []
-    pattern = rf"<{item_tag}>(.*?)</{item_tag}>"
-    return [m.group(1).strip() for m in re.finditer(pattern, parent_content, re.DOTALL)]
+    return [content.strip() for _, content in iter_tags(parent_content, (item_tag,))]
 
@@ -1,8 +1,13 @@
 """Onboarding prompt for understanding user's daily intentions and values."""
 
-from dataclasses import dataclass, field
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING
 
-from .base import BasePrompt, PromptMessage, extract_tag, extract_list
+from .base import BasePrompt, PromptMessage, extract_tag, extract_partial_tag, iter_tags
+
+if TYPE_CHECKING:
+    from ai_client import AIMessage
 
 
 ONBOARDING_SYSTEM_PROMPT = """\
@@ -90,7 +95,12 @@ Continue the conversation naturally, incorporate the new info, and when ready, a
 """
 
 
-@dataclass
+# Top-level sections of a response, and the list items inside <profile>
+_SECTION_TAGS = ("response", "onboarding_status", "profile")
+_PROFILE_ITEM_TAGS = ("intention", "value", "goal")
+
+
+@dataclass(slots=True)
 class OnboardingResult:
     """Parsed result from an onboarding response."""
 
@@ -104,34 +114,41 @@ class OnboardingResult:
     def parse(cls, llm_output: str) -> "OnboardingResult":
         """Parse LLM output into structured result.
 
+        The output is scanned once for its top-level sections; only the
+        small status and profile sections are scanned again.
+
         Args:
             llm_output: Raw output from the LLM
 
         Returns:
             Parsed OnboardingResult
         """
+        # First occurrence of each top-level section
+        sections: dict[str, str] = {}
+        for tag, content in iter_tags(llm_output, _SECTION_TAGS):
+            sections.setdefault(tag, content)
+
         # Extract response text
-        response_text = extract_tag(llm_output, "response")
+        response_text = sections.get("response", "").strip()
         if not response_text:
             # Fallback: use the whole output if no tags found
             response_text = llm_output.strip()
 
         # Check completion status
-        status_content = extract_tag(llm_output, "onboarding_status")
-        complete_str = extract_tag(status_content or "", "complete") if status_content else None
-        is_complete = complete_str and complete_str.lower() == "true"
+        status_content = sections.get("onboarding_status")
+        complete_str = extract_tag(status_content, "complete") if status_content else None
+        is_complete = complete_str is not None and complete_str.lower() == "true"
 
         # Extract profile if complete
         daily_intentions: list[str] = []
         values: list[str] = []
         goals: list[str] = []
 
-        if is_complete:
-            profile_content = extract_tag(llm_output, "profile")
-            if profile_content:
-                daily_intentions = extract_list(profile_content, "daily_intentions", "intention")
-                values = extract_list(profile_content, "values", "value")
-                goals = extract_list(profile_content, "goals", "goal")
+        profile_content = sections.get("profile")
+        if is_complete and profile_content:
+            lists = {"intention": daily_intentions, "value": values, "goal": goals}
+            for tag, content in iter_tags(profile_content, _PROFILE_ITEM_TAGS):
+                lists[tag].append(content.strip())
 
         return cls(
             response_text=response_text,
@@ -141,24 +158,116 @@ class OnboardingResult:
             goals=goals,
         )
 
+    @staticmethod
+    def complete_response(llm_output: str) -> str | None:
+        """Extract the reply text once its tag has closed.
+
+        The text is then final: it is what parse will return as
+        response_text, even while later sections are still streaming.
+
+        Args:
+            llm_output: LLM output received so far
+
+        Returns:
+            The reply text, or None if the tag hasn't closed or is empty
+        """
+        return extract_tag(llm_output, "response") or None
+
+    @staticmethod
+    def partial_response(llm_output: str) -> str | None:
+        """Extract the reply text from a response that is still streaming.
+
+        Args:
+            llm_output: LLM output received so far
+
+        Returns:
+            The reply text so far, or None if it hasn't started
+        """
+        return extract_partial_tag(llm_output, "response") or None
+
 
 class OnboardingPrompt(BasePrompt):
     """Prompt template for onboarding conversations."""
 
+    # The system prompt never changes, so its message is built once. It
+    # isn't a cache breakpoint: at ~600 tokens it is below the minimum
+    # cacheable prefix, and Anthropic would ignore the marker
+    _SYSTEM_MESSAGE = PromptMessage(role="system", content=ONBOARDING_SYSTEM_PROMPT)
+
+    # Messages at the end of the history left out of the cached prefix;
+    # the turns before them are the same on the next call
+    UNCACHED_TAIL = 2
+
+    # Anthropic only caches prefixes of at least this many tokens (1024
+    # for Sonnet); prefix sizes are estimated at CHARS_PER_TOKEN
+    MIN_CACHEABLE_TOKENS = 1024
+    CHARS_PER_TOKEN = 4
+
     @property
     def system_prompt(self) -> str:
         return ONBOARDING_SYSTEM_PROMPT
 
-    def format_messages(self, history: list[PromptMessage]) -> list[PromptMessage]:
+    def cache_breakpoint(
+        self,
+        history: Sequence["PromptMessage | AIMessage"],
+        window: int | None = None,
+    ) -> int | None:
+        """Index of the history message that ends the cached prefix.
+
+        Args:
+            history: User/assistant messages, oldest first
+            window: Most messages the caller ever sends, if it truncates
+                the conversation to its newest ones
+
+        Returns:
+            The index, or None if the history is too short to cache (the
+            prefix up to the breakpoint, system prompt included, must
+            reach MIN_CACHEABLE_TOKENS) or fills the window: from then on
+            its oldest message drops off every turn, so no prefix is
+            ever sent twice
+        """
+        if len(history) <= self.UNCACHED_TAIL:
+            return None
+        if window is not None and len(history) >= window:
+            return None
+        split = len(history) - self.UNCACHED_TAIL - 1
+        prefix_chars = len(ONBOARDING_SYSTEM_PROMPT) + sum(
+            len(msg.content) for msg in history[:split + 1]
+        )
+        if prefix_chars < self.MIN_CACHEABLE_TOKENS * self.CHARS_PER_TOKEN:
+            return None
+        return split
+
+    def format_messages(
+        self,
+        history: list[PromptMessage],
+        window: int | None = None,
+        system_message: "PromptMessage | AIMessage | None" = None,
+    ) -> list[PromptMessage]:
         """Format conversation history with system prompt.
 
+        The system prompt comes first and the history follows in
+        chronological order, so each call shares its prefix with the last.
+        Once that prefix is long enough to cache, it is marked for caching
+        up to the newest turns.
+
         Args:
-            history: List of user/assistant messages
+            history: List of user/assistant messages, oldest first
+            window: Passed through to cache_breakpoint
+            system_message: The system prompt as a message of the same
+                type as the history; defaults to a PromptMessage
 
         Returns:
             Messages ready for LLM API call
         """
-        messages = [PromptMessage(role="system", content=self.system_prompt)]
-        messages.extend(history)
-        return messages
+        system_message = system_message or self._SYSTEM_MESSAGE
+        split = self.cache_breakpoint(history, window)
+        if split is None:
+            return [system_message, *history]
+        return [
+            system_message,
+            *history[:split],
+            replace(history[split], cache=True),
+            *history[split + 1:],
+        ]
 
@@ -1,8 +1,10 @@
 """Pondering prompt for classifying and cleaning user thoughts/observations."""
 
+import json
 from dataclasses import dataclass
+from typing import Any
 
-from .base import PromptMessage, extract_tag
+from .base import PromptMessage, extract_tag, extract_tags
 
 
 PONDERING_SYSTEM_PROMPT = """\
@@ -41,64 +43,51 @@ Given a user's message, determine:
 
 ## Response Format
 
-ALWAYS respond with these XML tags:
-
-<classification>
-<is_valid>true or false</is_valid>
-<category>thought, observation, feeling, or invalid</category>
-</classification>
-
-<cleaned>
-If valid: The user's message refined into a clear first-person statement.
-Preserve their voice and meaning. Clean up grammar, remove filler words, but keep it authentic.
-If invalid: leave this empty or omit.
-</cleaned>
-
-<interpretation>
-If valid: Your analysis of what this message reveals. Consider:
-- What underlying need, desire, or concern might this reflect?
-- What patterns or themes might this connect to?
-- What does this suggest about their values, priorities, or current state?
-- Any potential blind spots or growth opportunities?
-Keep it concise (2-4 sentences). Be insightful but not presumptuous.
-If invalid: leave this empty or omit.
-</interpretation>
+ALWAYS respond with JSON and nothing else. For a single message, respond with one JSON object on one line (when asked to classify several messages, respond with a JSON array of these objects instead):
+
+{"v": true or false, "c": "thought", "observation", "feeling", or "invalid", "cl": "...", "i": "..."}
+
+- "v": whether the message is valid
+- "c": the category
+- "cl": If valid: the user's message refined into a clear first-person statement. Preserve their voice and meaning. Clean up grammar, remove filler words, but keep it authentic. If invalid: omit.
+- "i": If valid: your analysis of what this message reveals. Consider:
+  - What underlying need, desire, or concern might this reflect?
+  - What patterns or themes might this connect to?
+  - What does this suggest about their values, priorities, or current state?
+  - Any potential blind spots or growth opportunities?
+  Keep it concise (2-4 sentences). Be insightful but not presumptuous. If invalid: omit.
 
 ## Examples
 
 User: "just realized I've been avoiding that project because I'm scared of failing"
-<classification>
-<is_valid>true</is_valid>
-<category>thought</category>
-</classification>
-<cleaned>I just realized I've been avoiding that project because I'm scared of failing.</cleaned>
-<interpretation>This shows self-awareness about a fear-based avoidance pattern. The user values success and may tie their self-worth to outcomes. Recognizing this fear is the first step toward addressing it—they might benefit from reframing failure as learning.</interpretation>
+{"v": true, "c": "thought", "cl": "I just realized I've been avoiding that project because I'm scared of failing.", "i": "This shows self-awareness about a fear-based avoidance pattern. The user values success and may tie their self-worth to outcomes. Recognizing this fear is the first step toward addressing it—they might benefit from reframing failure as learning."}
 
 User: "noticed my energy dips after lunch every day"
-<classification>
-<is_valid>true</is_valid>
-<category>observation</category>
-</classification>
-<cleaned>I noticed my energy dips after lunch every day.</cleaned>
-<interpretation>The user is paying attention to their body's rhythms, which suggests they care about optimizing their performance. This pattern might be related to diet, sleep, or natural circadian rhythms. Worth exploring what they eat for lunch or how they might restructure their day around this dip.</interpretation>
+{"v": true, "c": "observation", "cl": "I noticed my energy dips after lunch every day.", "i": "The user is paying attention to their body's rhythms, which suggests they care about optimizing their performance. This pattern might be related to diet, sleep, or natural circadian rhythms. Worth exploring what they eat for lunch or how they might restructure their day around this dip."}
 
 User: "feeling kinda off today"
-<classification>
-<is_valid>true</is_valid>
-<category>feeling</category>
-</classification>
-<cleaned>I'm feeling off today.</cleaned>
-<interpretation>A vague unease that the user can't quite name. This emotional check-in, even if unclear, shows they're attuned to their inner state. It might be worth gently exploring what "off" means—physical, emotional, or situational.</interpretation>
+{"v": true, "c": "feeling", "cl": "I'm feeling off today.", "i": "A vague unease that the user can't quite name. This emotional check-in, even if unclear, shows they're attuned to their inner state. It might be worth gently exploring what 'off' means—physical, emotional, or situational."}
 
 User: "what's the weather like?"
-<classification>
-<is_valid>false</is_valid>
-<category>invalid</category>
-</classification>
+{"v": false, "c": "invalid"}
+"""
+
+
+# Appended to the system prompt's task when several messages are
+# classified at once; the system prompt itself stays the same
+PONDERING_BATCH_INSTRUCTIONS = """\
+Classify each of the {count} messages below separately, exactly as you would a single message.
+Respond with a JSON array of the {count} result objects, one per message, in order, and nothing else.
+
 """
 
+_CATEGORIES = frozenset({"thought", "observation", "feeling", "invalid"})
+
+# Fields read from a valid classification response in the XML format
+_VALID_RESULT_TAGS = frozenset({"category", "cleaned", "interpretation"})
+
 
-@dataclass
+@dataclass(slots=True)
 class PonderingResult:
     """Parsed result from pondering classification."""
 
@@ -111,49 +100,161 @@ class PonderingResult:
     def parse(cls, llm_output: str) -> "PonderingResult":
         """Parse LLM output into structured result.
 
+        The output is a JSON object; output in the earlier XML tag format
+        is still understood.
+
         Args:
             llm_output: Raw output from the LLM
 
         Returns:
             Parsed PonderingResult
         """
-        # Extract classification
-        classification = extract_tag(llm_output, "classification")
-        
-        is_valid_str = extract_tag(classification or "", "is_valid")
-        is_valid = is_valid_str and is_valid_str.lower() == "true"
+        data = _load_json(llm_output, "{", "}")
+        if isinstance(data, dict):
+            return cls.from_json(data)
+        return cls.parse_xml(llm_output)
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "PonderingResult":
+        """Build a result from a decoded JSON result object.
+
+        Args:
+            data: Object with keys v (valid), c (category), cl (cleaned)
+                and i (interpretation)
+
+        Returns:
+            The PonderingResult
+        """
+        if data.get("v") is not True:
+            return cls(
+                is_valid=False,
+                category="invalid",
+                cleaned_content=None,
+                interpretation=None,
+            )
         
-        category = extract_tag(classification or "", "category") or "invalid"
-        category = category.lower().strip()
+        category = data.get("c")
+        category = category.strip().lower() if isinstance(category, str) else "invalid"
         
         # Validate category
-        valid_categories = {"thought", "observation", "feeling", "invalid"}
-        if category not in valid_categories:
+        if category not in _CATEGORIES:
             category = "invalid"
         
-        # Extract cleaned content
-        cleaned_content = extract_tag(llm_output, "cleaned")
-        if cleaned_content:
-            cleaned_content = cleaned_content.strip()
+        return cls(
+            is_valid=True,
+            category=category,
+            cleaned_content=_json_text(data.get("cl")),
+            interpretation=_json_text(data.get("i")),
+        )
+
+    @classmethod
+    def parse_xml(cls, llm_output: str) -> "PonderingResult":
+        """Parse output in the XML tag format.
+
+        Args:
+            llm_output: Raw output from the LLM
+
+        Returns:
+            Parsed PonderingResult
+        """
+        # Validity first: an invalid result needs none of the other fields,
+        # so they are neither scanned for nor stripped
+        is_valid_str = extract_tag(llm_output, "is_valid")
+        if is_valid_str is None or is_valid_str.lower() != "true":
+            return cls(
+                is_valid=False,
+                category="invalid",
+                cleaned_content=None,
+                interpretation=None,
+            )
+        
+        # One scan for the rest; category sits inside <classification>
+        fields = extract_tags(llm_output, _VALID_RESULT_TAGS)
         
-        # Extract interpretation
-        interpretation = extract_tag(llm_output, "interpretation")
-        if interpretation:
-            interpretation = interpretation.strip()
+        category = (fields.get("category") or "invalid").lower()
         
-        # If invalid, cleaned_content and interpretation should be None
-        if not is_valid:
-            cleaned_content = None
-            interpretation = None
+        # Validate category
+        if category not in _CATEGORIES:
             category = "invalid"
         
         return cls(
-            is_valid=is_valid,
+            is_valid=True,
             category=category,
-            cleaned_content=cleaned_content,
-            interpretation=interpretation,
+            cleaned_content=fields.get("cleaned") or None,
+            interpretation=fields.get("interpretation") or None,
         )
 
+    @classmethod
+    def parse_batch(cls, llm_output: str, count: int) -> list["PonderingResult | None"]:
+        """Parse the output of a batch classification.
+
+        The output is a JSON array of result objects; output in the
+        earlier format of XML <result index="N"> blocks is still
+        understood.
+
+        Args:
+            llm_output: Raw output from the LLM
+            count: Number of messages in the batch
+
+        Returns:
+            One result per message, in order; None where the output has
+            no complete result for that message
+        """
+        data = _load_json(llm_output, "[", "]")
+        if not isinstance(data, list):
+            return cls._parse_xml_batch(llm_output, count)
+        results: list[PonderingResult | None] = [
+            cls.from_json(item) if isinstance(item, dict) else None
+            for item in data[:count]
+        ]
+        results.extend([None] * (count - len(results)))
+        return results
+
+    @classmethod
+    def _parse_xml_batch(cls, llm_output: str, count: int) -> list["PonderingResult | None"]:
+        """Parse batch output in the XML <result index="N"> format."""
+        results: list[PonderingResult | None] = []
+        for index in range(1, count + 1):
+            open_tag = f'<result index="{index}">'
+            start = llm_output.find(open_tag)
+            end = llm_output.find("</result>", start) if start >= 0 else -1
+            if end < 0:
+                results.append(None)
+                continue
+            results.append(cls.parse_xml(llm_output[start + len(open_tag):end]))
+        return results
+
+
+def _load_json(text: str, open_char: str, close_char: str) -> Any:
+    """Decode the outermost JSON value between open_char and close_char.
+
+    Tolerates text or a code fence around the value.
+
+    Returns:
+        The decoded value, or None if there is no valid JSON there
+    """
+    start = text.find(open_char)
+    end = text.rfind(close_char)
+    if start < 0 or end < start:
+        return None
+    try:
+        return json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+
+
+def _json_text(value: Any) -> str | None:
+    """A stripped string field of a JSON result, None if empty or missing."""
+    if not isinstance(value, str):
+        return None
+    return value.strip() or None
+
+
+# Static, so it is built once. Not a prompt-cache breakpoint: at ~900
+# tokens the prompt is below the minimum cacheable prefix (1024 tokens for
+# Sonnet, 2048 for Haiku), so Anthropic would ignore the marker
+_SYSTEM_MESSAGE = PromptMessage(role="system", content=PONDERING_SYSTEM_PROMPT)
+
 
 def create_pondering_messages(user_message: str) -> list[PromptMessage]:
     """Create messages for pondering classification.
@@ -165,7 +266,26 @@ def create_pondering_messages(user_message: str) -> list[PromptMessage]:
         List of messages ready for LLM API call
     """
     return [
-        PromptMessage(role="system", content=PONDERING_SYSTEM_PROMPT),
+        _SYSTEM_MESSAGE,
         PromptMessage(role="user", content=user_message),
     ]
 
+
+def create_pondering_batch_messages(user_messages: list[str]) -> list[PromptMessage]:
+    """Create messages for classifying several messages in one call.
+    
+    Args:
+        user_messages: The raw user messages to classify, in order
+        
+    Returns:
+        List of messages ready for LLM API call
+    """
+    numbered = "\n\n".join(
+        f"Message {index}: {text}" for index, text in enumerate(user_messages, 1)
+    )
+    content = PONDERING_BATCH_INSTRUCTIONS.format(count=len(user_messages)) + numbered
+    return [
+        _SYSTEM_MESSAGE,
+        PromptMessage(role="user", content=content),
+    ]
+
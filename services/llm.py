@@ -0,0 +1,62 @@
+"""Shared LLM client with bounded concurrency."""
+
+import asyncio
+import functools
+import os
+from collections.abc import AsyncIterator
+
+from ai_client import AIMessage, AIProvider, AIResponse, AIStream, create_ai_client
+
+# Maximum LLM requests in flight across all services
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+class _BoundedStream(AIStream):
+    """Stream that holds a concurrency slot until it is exhausted."""
+
+    def __init__(self, stream: AIStream, semaphore: asyncio.Semaphore):
+        super().__init__()
+        self._stream = stream
+        self._semaphore = semaphore
+
+    async def _iter_text(self) -> AsyncIterator[str]:
+        async with self._semaphore:
+            async for chunk in self._stream:
+                yield chunk
+        self.response = self._stream.response
+
+
+class BoundedAIClient:
+    """Wraps an AI provider so at most max_concurrency requests run at once.
+
+    Requests beyond the limit wait for a free slot instead of piling onto
+    the provider and tripping its rate limits. Only the calls the services
+    use are wrapped.
+    """
+
+    def __init__(self, provider: AIProvider, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.provider = provider
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def generate(self, messages: list[AIMessage], **kwargs) -> AIResponse:
+        """Generate a response once a concurrency slot is free."""
+        async with self._semaphore:
+            return await self.provider.generate(messages, **kwargs)
+
+    def generate_stream(self, messages: list[AIMessage], **kwargs) -> AIStream:
+        """Stream a response once a concurrency slot is free."""
+        return _BoundedStream(
+            self.provider.generate_stream(messages, **kwargs),
+            self._semaphore,
+        )
+
+
+@functools.cache
+def get_llm_client() -> BoundedAIClient:
+    """Get the LLM client shared by all services.
+
+    Created on first use, after the environment has been loaded. Set
+    LLM_MAX_CONCURRENCY to change the in-flight limit.
+    """
+    max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+    return BoundedAIClient(create_ai_client("anthropic"), max_concurrency)
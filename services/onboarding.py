@@ -1,16 +1,22 @@
 """Onboarding service - orchestrates the onboarding conversation flow."""
 
+import asyncio
 import logging
+import weakref
+from collections.abc import Awaitable, Callable
+from datetime import datetime
 from uuid import UUID
 
-from ai_client import AIMessage, create_ai_client
+from ai_client import AIMessage, AIProviderError
 from db import (
     UserRepository,
     MessageRepository,
     UserProfileRepository,
 )
 from db.models import User, Conversation, Message, MessageRole, OnboardingStatus
-from prompts import OnboardingPrompt, OnboardingResult, PromptMessage
+from prompts import OnboardingPrompt, OnboardingResult
+
+from .llm import get_llm_client
 
 logger = logging.getLogger(__name__)
 
@@ -19,80 +25,177 @@ logger = logging.getLogger(__name__)
 ONBOARDING_MODEL = "claude-sonnet-4-20250514"
 MAX_TOKENS = 1024
 
+# Messages of conversation history sent with each turn
+HISTORY_LIMIT = 20
+
+# Conversations whose converted history is kept between turns; the
+# least recently active are dropped first
+MAX_CACHED_CONVERSATIONS = 1024
+
 
 class OnboardingService:
     """Service for handling onboarding conversations."""
 
     def __init__(self):
         self.prompt = OnboardingPrompt()
-        self.ai_client = create_ai_client("anthropic")
+        self.ai_client = get_llm_client()
+        # Converted history per conversation, as of the end of its last
+        # turn: (sent_at of its newest message, last HISTORY_LIMIT - 1
+        # messages)
+        self._ai_msg_cache: dict[UUID, tuple[datetime, list[AIMessage]]] = {}
+        # Held for a whole turn, so a conversation's turns don't interleave
+        # and each sees the history the last one cached
+        self._turn_locks: weakref.WeakValueDictionary[UUID, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._system_message = AIMessage(role="system", content=self.prompt.system_prompt)
 
     async def handle_message(
         self,
         user: User,
         conversation: Conversation,
         message_text: str,
-    ) -> str:
+        on_partial: Callable[[str], Awaitable[None]] | None = None,
+    ) -> tuple[str, OnboardingStatus]:
         """Handle an incoming message during onboarding.
 
         Args:
             user: The user sending the message
             conversation: The current conversation
             message_text: The user's message
+            on_partial: Optional callback that streams the response; called
+                with the reply text received so far as it grows
 
         Returns:
-            The bot's response text
+            Tuple of (the bot's response text, the user's onboarding status
+            after this message)
         """
-        # 1. Store user's message
-        await MessageRepository.create(
-            conversation_id=conversation.id,
-            role=MessageRole.USER,
-            content=message_text,
+        lock = self._turn_locks.get(conversation.id)
+        if lock is None:
+            lock = self._turn_locks[conversation.id] = asyncio.Lock()
+        async with lock:
+            return await self._handle_turn(user, conversation, message_text, on_partial)
+
+    async def _handle_turn(
+        self,
+        user: User,
+        conversation: Conversation,
+        message_text: str,
+        on_partial: Callable[[str], Awaitable[None]] | None,
+    ) -> tuple[str, OnboardingStatus]:
+        """Handle one message; see handle_message."""
+        # 1. Store user's message and get the history in AI client format
+        cached = self._cached_history(conversation)
+        if cached is not None:
+            # Nothing was written since the last turn: its history plus
+            # the new message is what the database would return
+            await MessageRepository.create(
+                conversation_id=conversation.id,
+                role=MessageRole.USER,
+                content=message_text,
+            )
+            history = [*cached, AIMessage(role=MessageRole.USER.value, content=message_text)]
+        else:
+            history = await self._load_history(conversation.id, message_text)
+
+        # 2. Build full prompt with system message
+        ai_messages = self.prompt.format_messages(
+            history, window=HISTORY_LIMIT, system_message=self._system_message
         )
 
-        # 2. Load conversation history
-        messages = await MessageRepository.get_conversation_messages(
-            conversation_id=conversation.id,
-            limit=20,  # Last 20 messages should be plenty for context
+        # 3. Stream the LLM output; storing the reply starts as soon as its
+        # tag closes, while the status and profile are still generating
+        logger.info(f"Calling LLM for onboarding (user={user.id})")
+        llm_output, store_reply = await self._stream_response(
+            conversation.id, ai_messages, on_partial
         )
 
-        # 3. Convert to prompt format
-        history = self._messages_to_prompt_history(messages)
+        # 4. Parse response, and store the reply if it wasn't already
+        result = OnboardingResult.parse(llm_output)
+        logger.info(f"Onboarding response parsed (complete={result.is_complete})")
+        if store_reply is None:
+            store_reply = self._store_reply(conversation.id, result.response_text)
+        reply = await store_reply
+
+        # 5. If complete, save profile and update status
+        if result.is_complete:
+            self._ai_msg_cache.pop(conversation.id, None)
+            await self._complete_onboarding(user, result)
+            return result.response_text, OnboardingStatus.COMPLETED
 
-        # 4. Build full prompt with system message
-        prompt_messages = self.prompt.format_messages(history)
+        self._remember_history(conversation.id, history, reply)
+        return result.response_text, user.onboarding_status
 
-        # 5. Convert to AI client format
-        ai_messages = [
-            AIMessage(role=msg.role, content=msg.content)
-            for msg in prompt_messages
-        ]
+    async def _stream_response(
+        self,
+        conversation_id: UUID,
+        ai_messages: list[AIMessage],
+        on_partial: Callable[[str], Awaitable[None]] | None,
+    ) -> tuple[str, asyncio.Task[Message] | None]:
+        """Stream the LLM output, reporting the reply text as it grows.
 
-        # 6. Call LLM
-        logger.info(f"Calling LLM for onboarding (user={user.id})")
-        response = await self.ai_client.generate(
+        Once the reply tag has closed, its text is final and storing it
+        starts in the background; if the stream or on_partial fails after
+        that, the write is cancelled before the error propagates. If the
+        stream fails before any output arrives, the request is retried
+        without streaming.
+
+        Args:
+            conversation_id: The conversation the reply belongs to
+            ai_messages: Messages for the LLM call
+            on_partial: Called with the reply text received so far
+
+        Returns:
+            Tuple of (the complete LLM output, the task storing the reply,
+            or None if it hasn't been started)
+        """
+        stream = self.ai_client.generate_stream(
             messages=ai_messages,
             model=ONBOARDING_MODEL,
             max_tokens=MAX_TOKENS,
         )
+        llm_output = ""
+        store_reply: asyncio.Task[Message] | None = None
+        try:
+            async for chunk in stream:
+                llm_output += chunk
+                if store_reply is not None:
+                    continue
+                reply_text = OnboardingResult.complete_response(llm_output)
+                if reply_text:
+                    store_reply = asyncio.create_task(
+                        self._store_reply(conversation_id, reply_text)
+                    )
+                if on_partial is not None:
+                    partial = reply_text or OnboardingResult.partial_response(llm_output)
+                    if partial:
+                        await on_partial(partial)
+        except BaseException as e:
+            if store_reply is not None:
+                # The turn fails: don't leave the reply's write running
+                # unowned, or its result unretrieved
+                store_reply.cancel()
+                await asyncio.gather(store_reply, return_exceptions=True)
+                raise
+            if not isinstance(e, AIProviderError) or llm_output:
+                raise
+            logger.warning(f"Streaming failed, retrying without streaming: {e}")
+            response = await self.ai_client.generate(
+                messages=ai_messages,
+                model=ONBOARDING_MODEL,
+                max_tokens=MAX_TOKENS,
+            )
+            llm_output = response.content
+        return llm_output, store_reply
 
-        # 7. Parse response
-        result = OnboardingResult.parse(response.content)
-        logger.info(f"Onboarding response parsed (complete={result.is_complete})")
-
-        # 8. Store assistant message
-        await MessageRepository.create(
-            conversation_id=conversation.id,
+    async def _store_reply(self, conversation_id: UUID, reply_text: str) -> Message:
+        """Store the assistant's reply."""
+        return await MessageRepository.create(
+            conversation_id=conversation_id,
             role=MessageRole.ASSISTANT,
-            content=result.response_text,
+            content=reply_text,
         )
 
-        # 9. If complete, save profile and update status
-        if result.is_complete:
-            await self._complete_onboarding(user, result)
-
-        return result.response_text
-
     async def _complete_onboarding(
         self,
         user: User,
@@ -106,46 +209,106 @@ class OnboardingService:
         """
         logger.info(f"Completing onboarding for user {user.id}")
 
-        # Save user profile
         raw_extraction = {
             "daily_intentions": result.daily_intentions,
             "values": result.values,
             "goals": result.goals,
         }
 
-        await UserProfileRepository.upsert(
-            user_id=user.id,
-            daily_intentions=result.daily_intentions,
-            values=result.values,
-            goals=result.goals,
-            raw_extraction=raw_extraction,
-        )
-
-        # Update user onboarding status
-        await UserRepository.update_onboarding_status(
-            user.id,
-            OnboardingStatus.COMPLETED,
+        # Save user profile and update onboarding status, concurrently
+        await asyncio.gather(
+            UserProfileRepository.upsert(
+                user_id=user.id,
+                daily_intentions=result.daily_intentions,
+                values=result.values,
+                goals=result.goals,
+                raw_extraction=raw_extraction,
+            ),
+            UserRepository.update_onboarding_status(
+                user.id,
+                OnboardingStatus.COMPLETED,
+            ),
         )
 
         logger.info(f"Onboarding completed for user {user.id}")
 
-    def _messages_to_prompt_history(
+    def _cached_history(self, conversation: Conversation) -> list[AIMessage] | None:
+        """The history cached by the conversation's last turn, if current.
+
+        It is current if no message was written to the conversation after
+        that turn's reply (by /start or /northstar, say).
+
+        Args:
+            conversation: The conversation, as loaded for this message
+
+        Returns:
+            The cached messages, or None if there are none or they are stale
+        """
+        cached = self._ai_msg_cache.get(conversation.id)
+        if cached is None:
+            return None
+        reply_sent_at, history = cached
+        last_message_at = conversation.last_message_at
+        if last_message_at is None or last_message_at > reply_sent_at:
+            return None
+        return history
+
+    async def _load_history(
         self,
-        messages: list[Message],
-    ) -> list[PromptMessage]:
-        """Convert database messages to prompt format.
+        conversation_id: UUID,
+        message_text: str,
+    ) -> list[AIMessage]:
+        """Store the user's message and load the history from the database.
 
         Args:
-            messages: List of Message objects from database
+            conversation_id: The conversation
+            message_text: The user's message
 
         Returns:
-            List of PromptMessage objects
+            The newest HISTORY_LIMIT messages, ending with the user's, in AI
+            client format
         """
+        # Store while loading; the two are independent, so they share one
+        # round-trip's wait
+        stored, messages = await asyncio.gather(
+            MessageRepository.create(
+                conversation_id=conversation_id,
+                role=MessageRole.USER,
+                content=message_text,
+            ),
+            MessageRepository.get_recent_messages(
+                conversation_id=conversation_id,
+                limit=HISTORY_LIMIT,  # Last 20 messages should be plenty for context
+            ),
+        )
+
+        # Add the new message unless the load already saw it
+        if not messages or messages[-1].id != stored.id:
+            messages.append(stored)
+            del messages[:-HISTORY_LIMIT]
+
         return [
-            PromptMessage(
-                role=msg.role.value,  # "user" or "assistant"
-                content=msg.content,
-            )
+            AIMessage(role=msg.role.value, content=msg.content)  # "user" or "assistant"
             for msg in messages
         ]
 
+    def _remember_history(
+        self,
+        conversation_id: UUID,
+        history: list[AIMessage],
+        reply: Message,
+    ) -> None:
+        """Cache a turn's history, with its reply, for the next turn.
+
+        Args:
+            conversation_id: The conversation
+            history: The history sent to the LLM this turn
+            reply: The stored assistant message
+        """
+        history.append(AIMessage(role=reply.role.value, content=reply.content))
+        # Next turn sends HISTORY_LIMIT messages, the newest of them new
+        del history[:-(HISTORY_LIMIT - 1)]
+        self._ai_msg_cache.pop(conversation_id, None)
+        if len(self._ai_msg_cache) >= MAX_CACHED_CONVERSATIONS:
+            del self._ai_msg_cache[next(iter(self._ai_msg_cache))]
+        self._ai_msg_cache[conversation_id] = (reply.sent_at, history)
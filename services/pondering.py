@@ -1,25 +1,140 @@
 """Pondering service - classifies and stores user thoughts/observations."""
 
+import asyncio
+import hashlib
 import logging
+import os
+import re
+from collections.abc import Awaitable, Callable
 from uuid import UUID
 
-from ai_client import AIMessage, create_ai_client
+from ai_client import AIMessage
 from db import PonderingRepository
 from db.models import Pondering, PonderingCategory
-from prompts import PonderingResult, create_pondering_messages
+from prompts import PonderingResult, create_pondering_batch_messages, create_pondering_messages
+
+from .llm import get_llm_client
+from .pondering_cache import get_pondering_cache
 
 logger = logging.getLogger(__name__)
 
 # Model configuration
-PONDERING_MODEL = "claude-sonnet-4-20250514"
-MAX_TOKENS = 800  # Increased for interpretation and richer responses
+# Classification is a narrow, structured task: Haiku answers it faster and
+# cheaper than Sonnet. Override with the PONDERING_MODEL env var.
+PONDERING_MODEL = "claude-3-5-haiku-20241022"
+MAX_TOKENS = 400  # Classification and a 2-4 sentence interpretation
+# Rough characters per token, to leave room for the cleaned rewrite of
+# longer messages on top of MAX_TOKENS
+CHARS_PER_TOKEN = 4
+
+# Messages the classification prompt itself lists as invalid, caught
+# locally so they don't cost an LLM round trip
+_TRIVIAL_MESSAGES = frozenset({
+    "hi", "hello", "hey", "ok", "okay", "k", "yes", "no", "yep", "nope",
+    "test", "testing", "sup", "thanks", "thx", "lol",
+})
+# Drawn-out greetings and acknowledgements ("hiii", "heyyy", "okkk")
+_TRIVIAL_PATTERN = re.compile(r"h+i+|he+y+|hel+o+|o+k+|ye+s+|no+|te+st+", re.IGNORECASE)
+_TRIVIAL_PUNCTUATION = " \t\n.,!?~"
+
+# Messages from one user arriving within this many seconds of the first
+# are classified together, up to MAX_BATCH per call
+BATCH_WINDOW = 0.5
+MAX_BATCH = 5
+
+
+def _max_tokens(message_text: str) -> int:
+    """Output token cap for classifying a message."""
+    return MAX_TOKENS + len(message_text) // CHARS_PER_TOKEN
+
+
+def _content_hash(message_text: str) -> bytes:
+    """Hash identifying repeat submissions of the same message.
+
+    BLAKE2b-128 of the normalized text: faster than SHA-2 and ample for
+    telling one user's messages apart.
+    """
+    return hashlib.blake2b(message_text.strip().lower().encode(), digest_size=16).digest()
+
+
+def _trivially_invalid(message_text: str) -> bool:
+    """Whether a message is obviously not a pondering (greeting, "ok", ...)."""
+    text = message_text.strip(_TRIVIAL_PUNCTUATION).lower()
+    return (
+        len(text) < 3
+        or text in _TRIVIAL_MESSAGES
+        or _TRIVIAL_PATTERN.fullmatch(text) is not None
+    )
+
+
+class PonderingBatcher:
+    """Groups each user's back-to-back messages into one classification.
+
+    The first message from a user opens a window of BATCH_WINDOW seconds;
+    messages arriving in it join the batch, which is classified in a
+    single call when the window closes or it reaches max_batch. Each
+    caller gets back the result for its own message.
+    """
+
+    def __init__(
+        self,
+        classify_many: Callable[[UUID, list[str]], Awaitable[list[PonderingResult | None]]],
+        window: float = BATCH_WINDOW,
+        max_batch: int = MAX_BATCH,
+    ):
+        self._classify_many = classify_many
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: dict[UUID, list[tuple[str, asyncio.Future]]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def classify(self, user_id: UUID, message_text: str) -> PonderingResult | None:
+        """Classify a message together with the user's other pending ones."""
+        future = asyncio.get_running_loop().create_future()
+        batch = self._pending.get(user_id)
+        if batch is None:
+            batch = self._pending[user_id] = []
+            self._spawn(self._flush_later(user_id, batch))
+        batch.append((message_text, future))
+        if len(batch) >= self.max_batch:
+            del self._pending[user_id]
+            self._spawn(self._flush(user_id, batch))
+        return await future
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush_later(self, user_id: UUID, batch: list) -> None:
+        await asyncio.sleep(self.window)
+        # Unless it already filled up and was flushed
+        if self._pending.get(user_id) is batch:
+            del self._pending[user_id]
+            await self._flush(user_id, batch)
+
+    async def _flush(self, user_id: UUID, batch: list[tuple[str, asyncio.Future]]) -> None:
+        """Classify a batch and resolve each caller's future."""
+        try:
+            results = await self._classify_many(user_id, [text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
 
 
 class PonderingService:
     """Service for classifying and storing user ponderings."""
 
     def __init__(self):
-        self.ai_client = create_ai_client("anthropic")
+        self.ai_client = get_llm_client()
+        self.model = os.getenv("PONDERING_MODEL") or PONDERING_MODEL
+        self.batcher = PonderingBatcher(self._classify_many)
+        self.cache = get_pondering_cache()
 
     async def process_message(
         self,
@@ -37,10 +152,110 @@ class PonderingService:
         Returns:
             The created Pondering if valid, None if classification failed
         """
+        if _trivially_invalid(message_text):
+            logger.info(f"Pondering prefiltered as invalid (user={user_id})")
+            result = PonderingResult(
+                is_valid=False,
+                category="invalid",
+                cleaned_content=None,
+                interpretation=None,
+            )
+        else:
+            result = await self._classify_cached(user_id, message_text)
+            if result is None:
+                return None
+
+        # Map category string to enum
+        category = PonderingCategory.from_value(result.category)
+
+        # Store in database
+        pondering = await PonderingRepository.create(
+            user_id=user_id,
+            conversation_id=conversation_id,
+            raw_content=message_text,
+            cleaned_content=result.cleaned_content,
+            interpretation=result.interpretation,
+            category=category,
+            is_valid=result.is_valid,
+            content_hash=_content_hash(message_text),
+        )
+
+        logger.info(
+            f"Pondering stored: id={pondering.id}, valid={result.is_valid}, "
+            f"has_interpretation={result.interpretation is not None}"
+        )
+        return pondering
+
+    async def _classify_cached(self, user_id: UUID, message_text: str) -> PonderingResult | None:
+        """Classify a message, reusing the result for a similar earlier one."""
+        if self.cache is None:
+            return await self.batcher.classify(user_id, message_text)
+
+        embedding = await self.cache.embed(message_text)
+        result = self.cache.get(embedding, user_id, message_text)
+        if result is not None:
+            logger.info(f"Pondering classification served from cache (user={user_id})")
+            return result
+
+        result = await self.batcher.classify(user_id, message_text)
+        if result is not None:
+            self.cache.put(embedding, user_id, result)
+        return result
+
+    async def _classify_many(
+        self,
+        user_id: UUID,
+        message_texts: list[str],
+    ) -> list[PonderingResult | None]:
+        """Classify several messages from one user with one LLM call.
+
+        Messages the batch output has no result for are classified on
+        their own instead.
+
+        Returns:
+            One result per message, None where the LLM call failed
+        """
+        if len(message_texts) == 1:
+            return [await self._classify(user_id, message_texts[0])]
+
+        prompt_messages = create_pondering_batch_messages(message_texts)
+        ai_messages = [
+            AIMessage(role=msg.role, content=msg.content, cache=msg.cache)
+            for msg in prompt_messages
+        ]
+
+        logger.info(f"Classifying {len(message_texts)} ponderings together (user={user_id})")
+        try:
+            response = await self.ai_client.generate(
+                messages=ai_messages,
+                model=self.model,
+                max_tokens=sum(map(_max_tokens, message_texts)),
+            )
+        except Exception as e:
+            logger.error(f"Failed to classify pondering batch: {e}")
+            return [None] * len(message_texts)
+
+        results = PonderingResult.parse_batch(response.content, len(message_texts))
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            logger.warning(f"Batch output missing {len(missing)} results, classifying them singly")
+            retried = await asyncio.gather(
+                *(self._classify(user_id, message_texts[i]) for i in missing)
+            )
+            for i, result in zip(missing, retried):
+                results[i] = result
+        return results
+
+    async def _classify(self, user_id: UUID, message_text: str) -> PonderingResult | None:
+        """Classify a message with the LLM.
+
+        Returns:
+            The parsed classification, or None if the LLM call failed
+        """
         # 1. Create classification prompt
         prompt_messages = create_pondering_messages(message_text)
         ai_messages = [
-            AIMessage(role=msg.role, content=msg.content)
+            AIMessage(role=msg.role, content=msg.content, cache=msg.cache)
             for msg in prompt_messages
         ]
 
@@ -49,8 +264,8 @@ class PonderingService:
         try:
             response = await self.ai_client.generate(
                 messages=ai_messages,
-                model=PONDERING_MODEL,
-                max_tokens=MAX_TOKENS,
+                model=self.model,
+                max_tokens=_max_tokens(message_text),
             )
         except Exception as e:
             logger.error(f"Failed to classify pondering: {e}")
@@ -63,23 +278,4 @@ class PonderingService:
             result.is_valid,
             result.category,
         )
-
-        # 4. Map category string to enum
-        category = PonderingCategory(result.category)
-
-        # 5. Store in database
-        pondering = await PonderingRepository.create(
-            user_id=user_id,
-            conversation_id=conversation_id,
-            raw_content=message_text,
-            cleaned_content=result.cleaned_content,
-            interpretation=result.interpretation,
-            category=category,
-            is_valid=result.is_valid,
-        )
-
-        logger.info(
-            f"Pondering stored: id={pondering.id}, valid={result.is_valid}, "
-            f"has_interpretation={result.interpretation is not None}"
-        )
-        return pondering
+        return result
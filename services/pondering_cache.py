@@ -0,0 +1,79 @@
+"""Semantic cache of pondering classifications."""
+
+import asyncio
+import functools
+import os
+from collections.abc import Callable, Sequence
+from dataclasses import asdict
+from typing import Any
+from uuid import UUID
+
+from ai_client import SemanticCache
+from prompts import PonderingResult
+
+# A cached classification is served for messages at least this similar
+SIMILARITY_THRESHOLD = 0.95
+# Seconds a cached classification stays valid
+CACHE_TTL = 7 * 24 * 60 * 60
+CACHE_SIZE = 10_000
+# Small local embedding model (384 dimensions)
+EMBEDDING_MODEL = "BAAI/bge-small-en-v1.5"
+
+
+class PonderingCache:
+    """Serves classifications of near-duplicate messages from memory.
+
+    Entries are scoped to the user who sent the message: the
+    interpretation is written about one user's private message and must
+    not end up in another user's pondering. The cleaned content is a
+    rewrite of one exact message, so a hit keeps the new message's own
+    text as its cleaned content.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        threshold: float = SIMILARITY_THRESHOLD,
+        ttl: float = CACHE_TTL,
+        maxsize: int = CACHE_SIZE,
+    ):
+        self._cache = SemanticCache(embed, threshold, maxsize)
+        self.ttl = ttl
+
+    async def embed(self, message_text: str) -> Any:
+        """Embed a message, off the event loop."""
+        return await asyncio.to_thread(self._cache.embed, message_text)
+
+    def get(self, embedding: Any, user_id: UUID, message_text: str) -> PonderingResult | None:
+        """Get the classification of a similar earlier message of the user, if any."""
+        entry = self._cache.get(embedding, str(user_id))
+        if entry is None:
+            return None
+        result = PonderingResult(**entry)
+        if result.cleaned_content is not None:
+            result.cleaned_content = message_text.strip()
+        return result
+
+    def put(self, embedding: Any, user_id: UUID, result: PonderingResult) -> None:
+        """Remember the classification of a user's embedded message."""
+        self._cache.put(embedding, asdict(result), str(user_id), self.ttl)
+
+
+@functools.cache
+def get_pondering_cache() -> PonderingCache | None:
+    """Get the shared pondering cache, or None if it is disabled.
+
+    Enabled by setting PONDERING_SEMANTIC_CACHE=1; needs the `semantic`
+    extra (numpy and fastembed). The embedding model is loaded here, on
+    first use.
+    """
+    if os.getenv("PONDERING_SEMANTIC_CACHE", "").lower() not in ("1", "true", "yes"):
+        return None
+    try:
+        from fastembed import TextEmbedding
+    except ImportError as e:
+        raise ImportError(
+            "The pondering cache requires fastembed. Install with: pip install 'alain[semantic]'"
+        ) from e
+    model = TextEmbedding(EMBEDDING_MODEL)
+    return PonderingCache(lambda text: next(iter(model.embed([text]))))
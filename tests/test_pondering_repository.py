@@ -0,0 +1,92 @@
+"""Tests for PonderingRepository.bulk_create deduplication."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from db import repository
+from db.models import PonderingCategory, PonderingInput
+from db.repository import PonderingRepository
+
+
+class FakeConnection:
+    """Records bulk inserts and returns a freshly inserted row per item."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def fetch(self, query, *args):
+        self.calls.append(args)
+        ids, user_ids, conversation_ids, raw, cleaned, interpretation, category, is_valid = args[:8]
+        now = datetime.now(timezone.utc)
+        return [
+            {
+                "item_id": ids[i],
+                "id": ids[i],
+                "user_id": user_ids[i],
+                "conversation_id": conversation_ids[i],
+                "raw_content": raw[i],
+                "cleaned_content": cleaned[i],
+                "interpretation": interpretation[i],
+                "category": category[i],
+                "is_valid": is_valid[i],
+                "received_at": now,
+                "processed_at": now,
+            }
+            for i in range(len(ids))
+        ]
+
+
+def _bulk_create(monkeypatch, items):
+    conn = FakeConnection()
+
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    monkeypatch.setattr(repository.Database, "acquire", acquire)
+    return asyncio.run(PonderingRepository.bulk_create(items)), conn
+
+
+def _item(user_id, text, content_hash):
+    return PonderingInput(
+        user_id=user_id,
+        conversation_id=uuid4(),
+        raw_content=text,
+        cleaned_content=text,
+        interpretation=None,
+        category=PonderingCategory.THOUGHT,
+        content_hash=content_hash,
+    )
+
+
+def test_identical_items_in_one_batch_are_written_once(monkeypatch):
+    user_id = uuid4()
+    items = [_item(user_id, "same thought", b"h" * 16), _item(user_id, "same thought", b"h" * 16)]
+
+    results, conn = _bulk_create(monkeypatch, items)
+
+    assert len(conn.calls) == 1
+    assert len(conn.calls[0][0]) == 1
+    assert len(results) == 2
+    assert results[0] is results[1]
+
+
+def test_other_users_and_unhashed_items_are_not_merged(monkeypatch):
+    user_id = uuid4()
+    items = [
+        _item(user_id, "a", b"h" * 16),
+        _item(uuid4(), "a", b"h" * 16),
+        _item(user_id, "b", None),
+        _item(user_id, "b", None),
+        _item(user_id, "a", b"h" * 16),
+    ]
+
+    results, conn = _bulk_create(monkeypatch, items)
+
+    assert len(conn.calls[0][0]) == 4
+    assert [r.raw_content for r in results] == ["a", "a", "b", "b", "a"]
+    assert results[4] is results[0]
+    assert results[1].user_id != user_id
+    assert results[2] is not results[3]